@@ -0,0 +1,206 @@
+import json
+import threading
+from queue import Queue, Empty
+from collections import deque
+from time import monotonic, sleep
+from collections import Counter
+from selenium.common.exceptions import WebDriverException
+
+# Constants
+QUEUE_POLL_TIME = 0.5  # Seconds an idle worker waits for the next job before checking whether the discovery is done.
+
+class RateLimiter:
+    # Keeps at least `min_interval` seconds between two job starts across all the workers.
+    def __init__(self, min_interval = 0):
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        self.next_start = 0
+
+    def wait(self):
+        with self.lock:
+            delay = self.next_start - monotonic()
+            self.next_start = max(self.next_start, monotonic()) + self.min_interval
+
+        if delay > 0:
+            sleep(delay)
+
+class ApplicationPool:
+    def __init__(self, app_factory, workers = 2, min_interval = 0, prefetch = 0, recycler = None):
+        # `app_factory` builds a fresh application object per worker, so that each of them has its own browser and state.
+        self.app_factory = app_factory
+        self.workers = max(1, workers)
+        self.rate_limiter = RateLimiter(min_interval)
+
+        # Jobs a worker claims ahead of the current one, so that it can load their pages in the background.
+        self.prefetch = max(0, prefetch)
+
+        # Optional `BrowserRecycler` restarting a worker's browser after a number of jobs or above a memory watermark.
+        self.recycler = recycler
+        self.recycles = 0
+
+        self.results = list()
+        self.results_lock = threading.Lock()
+
+        # Set once the discovery has handed over its last job, so that the idle workers know when to stop.
+        self.discovery_done = threading.Event()
+
+    def add_result(self, **result):
+        with self.results_lock:
+            self.results.append(result)
+
+    #region Worker
+
+    def start_session(self, worker_id, seed):
+        # The first worker re-uses the session which was used for discovering the jobs.
+        if seed:
+            return seed
+
+        app = self.app_factory()
+        return app, app.login()
+
+    def worker(self, worker_id, jobs, seed):
+        try:
+            app, driver = self.start_session(worker_id, seed)
+        except Exception as e: # A worker which can't log in must not take the whole pool down.
+            print(f'Worker { worker_id } could not start:\n', e)
+            self.add_result(worker = worker_id, job_id = None, title = None, link = None, status = 'worker_failed', error = repr(e), seconds = 0)
+            return
+
+        upcoming = deque()
+        session_jobs = 0
+
+        while True:
+            # Waiting for the discovery to hand over the next job, until it's done and the queue is empty.
+            if upcoming:
+                job = upcoming.popleft()
+            else:
+                try:
+                    job = jobs.get(timeout = QUEUE_POLL_TIME)
+                except Empty:
+                    if self.discovery_done.is_set():
+                        break
+                    continue
+
+            # Claiming the next few jobs already available, without waiting for more.
+            while len(upcoming) < self.prefetch:
+                try:
+                    upcoming.append(jobs.get_nowait())
+                except Empty:
+                    break
+
+            self.rate_limiter.wait()
+            start = monotonic()
+
+            try:
+                status = app.apply_to(driver, job, list(upcoming))
+                self.add_result(worker = worker_id, job_id = job.job_id, title = job.title, link = job.link, status = status, error = None, seconds = round(monotonic() - start, 3))
+
+            except Exception as e: # Isolating the failure of a job to the worker which picked it.
+                print(f'Worker { worker_id } failed on { job.title }:\n', e)
+                self.add_result(worker = worker_id, job_id = job.job_id, title = job.title, link = job.link, status = 'failed', error = repr(e), seconds = round(monotonic() - start, 3))
+
+                # Restarting the browser when the session itself is broken.
+                if isinstance(e, WebDriverException) and not self.is_alive(driver):
+                    try:
+                        driver.quit()
+                    except WebDriverException:
+                        pass
+
+                    try:
+                        app, driver = self.start_session(None, None)
+                        session_jobs = 0
+                    except Exception as e:
+                        print(f'Worker { worker_id } could not restart:\n', e)
+
+                        # Handing the claimed jobs back to the other workers.
+                        for job in upcoming:
+                            jobs.put(job)
+                        return
+
+            session_jobs += 1
+            reason = self.recycler.reason(driver, session_jobs) if self.recycler else None
+
+            if reason:
+                # A fresh browser of the same worker; the session cache signs it in without the login form.
+                print(f'Worker { worker_id } is recycling its browser after { reason }.')
+
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+
+                try:
+                    driver = app.login()
+                    session_jobs = 0
+                    self.recycles += 1
+                except Exception as e:
+                    print(f'Worker { worker_id } could not restart:\n', e)
+
+                    for job in upcoming:
+                        jobs.put(job)
+                    return
+
+        try:
+            driver.quit()
+        except WebDriverException: # The browser might have already crashed.
+            pass
+
+    def is_alive(self, driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    #endregion
+
+    def run(self, jobs, seed = None):
+        # `jobs` is any iterable of job records (a list or a discovery generator) and
+        # `seed` an optional already logged-in `(app, driver)` pair, which is also the one the discovery runs in.
+        queue = Queue()
+        start = monotonic()
+
+        # Starting the workers with their own sessions right away, so that they apply while the discovery goes on.
+        # The seed session joins them as the first worker once the discovery doesn't need it anymore.
+        threads = [
+            threading.Thread(target = self.worker, args = (worker_id, queue, None), name = f'worker-{ worker_id }')
+            for worker_id in range(1 if seed else 0, self.workers)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for job in jobs:
+                queue.put(job)
+        except Exception as e: # Applying to whatever was discovered before the failure.
+            print('Job discovery failed:\n', e)
+        finally:
+            self.discovery_done.set()
+
+        if seed:
+            self.worker(0, queue, seed)
+
+        for thread in threads:
+            thread.join()
+
+        return self.report(monotonic() - start, queue.qsize())
+
+    def report(self, elapsed, pending = 0):
+        # Merging the results of all the workers into a single report.
+        jobs = [result for result in self.results if result['title'] is not None]
+
+        return {
+            'elapsed_seconds': round(elapsed, 3),
+            'jobs': len(jobs),
+            'pending': pending, # Jobs left in the queue because all of the workers failed.
+            'jobs_per_minute': round(len(jobs) / elapsed * 60, 2) if elapsed else 0,
+            'status': dict(Counter(result['status'] for result in self.results)),
+            'per_worker': dict(Counter(result['worker'] for result in jobs)),
+            'browser_recycles': self.recycles,
+            'results': sorted(self.results, key = lambda result: result['worker']),
+        }
+
+    def save_report(self, report, path):
+        with open(path, 'w') as file:
+            json.dump(report, file, indent = 4)
@@ -0,0 +1,140 @@
+import os
+import json
+import argparse
+import configparser
+from time import monotonic
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from utils import load_application_class
+from tracing import tracer
+
+# Constants
+SHARDS = 2  # Processes running the candidates in parallel.
+BROWSERS_PER_SHARD = 2  # Browsers a shard may open at once, i.e. the upper bound of a candidate's workers.
+WORKSPACE = 'batch'  # Every candidate's ledger, logs, session and reports go to its own folder in here.
+
+def candidate_config(base_config_path, candidate, workspace, browsers):
+    # The shared `config.ini` with the candidate's credentials, profile, resumes and location, and all the state isolated.
+    config = configparser.ConfigParser()
+    config.read(base_config_path)
+
+    def section(name):
+        if not config.has_section(name):
+            config.add_section(name)
+        return config[name]
+
+    # `%` starts an interpolation in `configparser`, e.g. in a password.
+    def escape(value):
+        return str(value).replace('%', '%%')
+
+    section('credentials').update(email = escape(candidate['email']), password = escape(candidate['password']))
+    section('json')['json_path'] = escape(candidate['profile'])
+    section('candidate').update(
+        resume_folder = escape(candidate['resume_dir']),
+        location = candidate.get('location', section('candidate').get('location', 'CA/M2J 1S5/North York')),
+        log_path = os.path.join(workspace, 'Resume Log.txt'),
+    )
+    section('ledger')['path'] = os.path.join(workspace, 'Applications.sqlite3')
+    section('pool').update(
+        workers = str(min(int(candidate.get('workers', browsers)), browsers)),
+        report_path = os.path.join(workspace, 'Application Report.json'),
+    )
+    section('session')['cache_path'] = os.path.join(workspace, 'session_cache.json')
+    section('waits')['stats_path'] = os.path.join(workspace, 'wait_stats.json')
+    section('locators')['stats_path'] = os.path.join(workspace, 'locator_stats.json')
+    section('browser')['cache_dir'] = os.path.join(workspace, '.browser-cache')
+    section('tracing').update(
+        jsonl_path = os.path.join(workspace, 'Trace.jsonl'),
+        chrome_path = os.path.join(workspace, 'Trace.json'),
+    )
+
+    return config
+
+def run_candidate(application_class, base_config_path, candidate, workspace, browsers):
+    workspace = os.path.join(workspace, candidate['name'])
+    os.makedirs(workspace, exist_ok = True)
+
+    config_path = os.path.join(workspace, 'config.ini')
+    with open(config_path, 'w') as file:
+        candidate_config(base_config_path, candidate, workspace, browsers).write(file)
+
+    tracer.reset()
+    start = monotonic()
+
+    try:
+        report = application_class(config_path).run_application_process()
+    except Exception as e: # Isolating the failure of a candidate from the others of the shard.
+        print(f'Candidate { candidate["name"] } failed:\n', e)
+        return { 'candidate': candidate['name'], 'status': 'failed', 'error': repr(e), 'jobs': 0, 'statuses': dict(), 'seconds': round(monotonic() - start, 3) }
+
+    return {
+        'candidate': candidate['name'],
+        'status': 'done',
+        'error': None,
+        'jobs': report['jobs'],
+        'statuses': report['status'],
+        'seconds': round(monotonic() - start, 3),
+    }
+
+def run_shard(shard_id, candidates, base_config_path, workspace, browsers):
+    # A shard is one process going through its candidates one after another.
+    application_class = load_application_class()
+    return [dict(run_candidate(application_class, base_config_path, candidate, workspace, browsers), shard = shard_id) for candidate in candidates]
+
+def run_batch(manifest, shards = SHARDS, browsers = BROWSERS_PER_SHARD):
+    candidates = manifest['candidates']
+    base_config_path = manifest.get('config', 'config.ini')
+    workspace = manifest.get('workspace', WORKSPACE)
+    shards = max(1, min(shards, len(candidates)))
+
+    # Round-robin, so that the shards get a similar number of candidates.
+    shard_candidates = [candidates[shard_id : : shards] for shard_id in range(shards)]
+    start = monotonic()
+
+    with ProcessPoolExecutor(max_workers = shards) as executor:
+        futures = [
+            executor.submit(run_shard, shard_id, shard, base_config_path, workspace, browsers)
+            for shard_id, shard in enumerate(shard_candidates)
+        ]
+        results = [result for future in futures for result in future.result()]
+
+    return report(results, monotonic() - start)
+
+def report(results, elapsed):
+    # Throughput of the whole roster, next to the outcome of every candidate.
+    jobs = sum(result['jobs'] for result in results)
+    statuses = Counter()
+
+    for result in results:
+        statuses.update(result['statuses'])
+
+    return {
+        'elapsed_seconds': round(elapsed, 3),
+        'candidates': len(results),
+        'failed_candidates': sum(result['status'] == 'failed' for result in results),
+        'jobs': jobs,
+        'jobs_per_minute': round(jobs / elapsed * 60, 2) if elapsed else 0,
+        'status': dict(statuses),
+        'results': results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Applies for a roster of candidates, sharded across processes.')
+    parser.add_argument('manifest', help = 'JSON manifest: the base "config", a "workspace" folder and the "candidates".')
+    parser.add_argument('--shards', type = int, default = SHARDS)
+    parser.add_argument('--browsers-per-shard', type = int, default = BROWSERS_PER_SHARD)
+    parser.add_argument('--output', help = 'Where to save the combined report as JSON.')
+    arguments = parser.parse_args()
+
+    with open(arguments.manifest, 'r') as file:
+        manifest = json.load(file)
+
+    result = run_batch(manifest, arguments.shards, arguments.browsers_per_shard)
+    print(json.dumps(result, indent = 4))
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(result, file, indent = 4)
+
+if __name__ == '__main__':
+    main()
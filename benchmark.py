@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import argparse
+import tempfile
+from collections import Counter, defaultdict
+from selenium.webdriver.remote.webdriver import WebDriver
+from mock_workday import MockWorkday, JOB_TITLES, SEARCH_API_PATH
+from tracing import tracer
+from utils import load_application_class
+
+# Candidate profile used against the mock site; the mock renders its forms from the same `data-automation-id`s.
+SAMPLE_PROFILE = {
+    'personal_information': {
+        'first_name': { 'type': 'text', 'location': 'legalNameSection_firstName', 'value': 'Jane' },
+        'last_name': { 'type': 'text', 'location': 'legalNameSection_lastName', 'value': "O'Neil" },
+        'address': { 'type': 'text', 'location': 'addressSection_addressLine1', 'value': '1 Main St' },
+        'city': { 'type': 'text', 'location': 'addressSection_city', 'value': 'North York' },
+        'province': { 'type': 'dropdown', 'location': 'addressSection_countryRegion', 'key': 'ON', 'value': 'Ontario' },
+        'phone': { 'type': 'text', 'location': 'phone-number', 'value': '4165550100' },
+    },
+    'employment_history': [
+        {
+            'job_title': { 'type': 'text', 'location': 'jobTitle', 'value': 'Cashier' },
+            'company': { 'type': 'text', 'location': 'company', 'value': 'Corner Store' },
+            'start_date': { 'type': 'date', 'location': 'dateSectionMonth-input', 'value': '012020' },
+            'end_date': { 'type': 'date', 'location': 'dateSectionMonth-input', 'value': 'present' },
+        },
+    ],
+    'application_questions_1': {
+        'legally_eligible': { 'context': 'Yes' },
+        'age': { 'context': 'Yes' },
+    },
+    'application_questions_2': {
+        'Week 1': { 'Monday': True, 'Tuesday': False, 'None': False },
+        'Overall': { 'context': 'Any' },
+    },
+    'agreements': {
+        'terms': { 'type': 'checkbox', 'location': 'agreementCheckbox' },
+    },
+}
+
+CONFIG_TEMPLATE = '''[webdriver]
+driver_path = {driver_path}
+
+[walmart]
+login_url = {base_url}/login
+jobs_url = {base_url}/jobs
+referral_email = referrer@example.com
+
+[credentials]
+email = candidate@example.com
+password = password
+
+[json]
+json_path = profile.json
+
+[browser]
+browser = {browser}
+headless = {headless}
+block = images, fonts, media, trackers
+
+[pool]
+workers = {workers}
+
+[source]
+type = {source}
+endpoint = {base_url}{search_api_path}
+
+[tracing]
+enabled = true
+'''
+
+#region Round-Trip Counting
+
+command_counts = Counter()
+
+def count_commands():
+    # Every WebDriver command is one HTTP round-trip to the driver, so counting the `execute` calls counts the round-trips.
+    execute = WebDriver.execute
+
+    def counted_execute(self, driver_command, params = None):
+        command_counts[driver_command] += 1
+        return execute(self, driver_command, params)
+
+    WebDriver.execute = counted_execute
+
+#endregion
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(percent / 100 * len(values))) - 1))] if values else None
+
+def phase_statistics():
+    durations = defaultdict(list)
+
+    for span in tracer.spans:
+        durations[span['name']].append(span['duration_us'] / 1e6)
+
+    return {
+        name: { 'count': len(values), 'p50': round(percentile(values, 50), 3), 'p95': round(percentile(values, 95), 3) }
+        for name, values in sorted(durations.items())
+    }
+
+def prepare_workspace(directory, base_url, arguments):
+    os.makedirs(os.path.join(directory, 'Resume'), exist_ok = True)
+
+    for title in JOB_TITLES:
+        with open(os.path.join(directory, 'Resume', f'{ title }.pdf'), 'wb') as file:
+            file.write(b'%PDF-1.4\n%%EOF\n')
+
+    with open(os.path.join(directory, 'profile.json'), 'w') as file:
+        json.dump(SAMPLE_PROFILE, file, indent = 4)
+
+    with open(os.path.join(directory, 'config.ini'), 'w') as file:
+        file.write(CONFIG_TEMPLATE.format(
+            driver_path = arguments.driver_path or '',
+            base_url = base_url,
+            browser = arguments.browser,
+            headless = str(not arguments.headed).lower(),
+            workers = arguments.workers,
+            source = arguments.source,
+            search_api_path = SEARCH_API_PATH,
+        ))
+
+def run_benchmark(arguments):
+    mock = MockWorkday(
+        SAMPLE_PROFILE, jobs = arguments.jobs, latency = arguments.latency, jitter = arguments.jitter,
+        render_delay = arguments.render_delay, flaky_rate = arguments.flaky_rate, continue_rate = arguments.continue_rate
+    )
+    base_url = mock.start()
+    application_class = load_application_class()
+    count_commands()
+
+    working_directory = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as directory:
+        prepare_workspace(directory, base_url, arguments)
+
+        # The application works with the paths relative to the current directory.
+        os.chdir(directory)
+
+        try:
+            app = application_class('config.ini')
+            app.run_application_process()
+
+            with open(app.report_path, 'r') as file:
+                report = json.load(file)
+        finally:
+            os.chdir(working_directory)
+            mock.stop()
+
+    applications = max(1, report['jobs'])
+
+    return {
+        'applications': report['jobs'],
+        'status': report['status'],
+        'elapsed_seconds': report['elapsed_seconds'],
+        'applications_per_minute': report['jobs_per_minute'],
+        'round_trips': sum(command_counts.values()),
+        'round_trips_per_application': round(sum(command_counts.values()) / applications, 1),
+        'round_trips_by_command': dict(command_counts.most_common()),
+        'phases': phase_statistics(),
+    }
+
+def compare(result, baseline, tolerance):
+    # Regressions: throughput dropping, or the p95 of a phase growing, by more than the tolerance.
+    regressions = list()
+
+    if result['applications_per_minute'] < baseline['applications_per_minute'] * (1 - tolerance):
+        regressions.append(f"applications/minute { baseline['applications_per_minute'] } -> { result['applications_per_minute'] }")
+
+    for name, phase in result['phases'].items():
+        previous = baseline['phases'].get(name)
+        if previous and phase['p95'] > previous['p95'] * (1 + tolerance) and phase['p95'] - previous['p95'] > 0.1:
+            regressions.append(f"{ name } p95 { previous['p95'] }s -> { phase['p95'] }s")
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Benchmarks the Walmart application flow against a local mock Workday site.')
+    parser.add_argument('--jobs', type = int, default = 45)
+    parser.add_argument('--workers', type = int, default = 1)
+    parser.add_argument('--latency', type = float, default = 0.05, help = 'Seconds added to every response.')
+    parser.add_argument('--jitter', type = float, default = 0.05, help = 'Random extra seconds on top of the latency.')
+    parser.add_argument('--render-delay', type = int, default = 150, help = 'Milliseconds before a page renders its content.')
+    parser.add_argument('--flaky-rate', type = float, default = 0.0, help = 'Share of the pages answered with a 503.')
+    parser.add_argument('--continue-rate', type = float, default = 0.2, help = 'Share of the jobs showing "Continue Application".')
+    parser.add_argument('--source', choices = ['browser', 'workday'], default = 'browser', help = 'Where the job listings are read from.')
+    parser.add_argument('--browser', default = 'chrome')
+    parser.add_argument('--driver-path')
+    parser.add_argument('--headed', action = 'store_true')
+    parser.add_argument('--output', help = 'Where to save the result as JSON.')
+    parser.add_argument('--baseline', help = 'A previous result to compare with; exits with 1 on a regression.')
+    parser.add_argument('--tolerance', type = float, default = 0.2)
+    arguments = parser.parse_args()
+
+    result = run_benchmark(arguments)
+    print(json.dumps(result, indent = 4))
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(result, file, indent = 4)
+
+    if arguments.baseline:
+        with open(arguments.baseline, 'r') as file:
+            regressions = compare(result, json.load(file), arguments.tolerance)
+
+        for regression in regressions:
+            print('Regression:', regression)
+
+        sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import os
+
+try:
+    import psutil
+except ImportError: # Falling back to `/proc`, which is there on Linux only; elsewhere only the job count is used.
+    psutil = None
+
+# Constants
+RECYCLE_AFTER_JOBS = 50  # Applications after which the browser is restarted anyway.
+RECYCLE_ABOVE_MB = 1500  # Resident memory of the whole browser (driver, browser and renderer processes) to restart above.
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+#region Memory
+
+def proc_tree_rss(pid):
+    # Resident memory of the process and all of its descendants from `/proc/<pid>/stat`.
+    children, rss = dict(), dict()
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+
+        try:
+            with open(f'/proc/{ entry }/stat', 'r') as file:
+                # The fields after the command name, which is in parentheses and may contain spaces.
+                fields = file.read().rsplit(')', 1)[1].split()
+        except OSError: # The process exited in the meantime.
+            continue
+
+        children.setdefault(int(fields[1]), list()).append(int(entry))
+        rss[int(entry)] = int(fields[21]) * PAGE_SIZE
+
+    total, stack = 0, [pid]
+
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        stack.extend(children.get(current, ()))
+
+    return total
+
+def psutil_tree_rss(pid):
+    process = psutil.Process(pid)
+    total = 0
+
+    for member in [process] + process.children(recursive = True):
+        try:
+            total += member.memory_info().rss
+        except psutil.Error:
+            pass
+
+    return total
+
+def browser_rss(driver):
+    # Bytes used by the browser started by the driver, or `None` when it can't be measured (e.g. a remote driver).
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+
+    try:
+        if psutil:
+            return psutil_tree_rss(pid)
+
+        if os.path.isdir('/proc'):
+            return proc_tree_rss(pid)
+    except Exception as e: # Measuring must never break the run.
+        print('Could not measure the browser memory:\n', e)
+
+    return None
+
+#endregion
+
+class BrowserRecycler:
+    # Decides when a worker's browser has served long enough, so that the memory of long runs stays bounded.
+    def __init__(self, max_jobs = RECYCLE_AFTER_JOBS, max_mb = RECYCLE_ABOVE_MB):
+        self.max_jobs = max_jobs
+        self.max_bytes = max_mb * 1024 * 1024 if max_mb else None
+
+    def reason(self, driver, jobs):
+        # Why the browser should be restarted after `jobs` applications, or `None` when it can go on.
+        if self.max_jobs and jobs >= self.max_jobs:
+            return f'{ jobs } applications'
+
+        if self.max_bytes:
+            rss = browser_rss(driver)
+
+            if rss is not None and rss > self.max_bytes:
+                return f'{ rss / 1024 / 1024:.0f} MB in use'
+
+        return None
@@ -0,0 +1,156 @@
+import os
+import json
+import threading
+from types import MappingProxyType
+from dataclasses import dataclass
+
+# Keys which every field of a form needs, based on its type.
+FIELD_KEYS = {
+    'text': ('location', 'value'),
+    'paragraph': ('location', 'items'),
+    'dropdown': ('location', 'key', 'value'),
+    'radio': ('location',),
+    'checkbox': ('location',),
+    'date': ('location', 'value'),
+}
+
+class ProfileError(ValueError):
+    pass
+
+def freeze(value):
+    # Making the parsed JSON read-only so that a snapshot shared by the workers can't be changed by any of them.
+    if isinstance(value, dict):
+        return MappingProxyType({ key: freeze(item) for key, item in value.items() })
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+#region Validation
+
+def validate_fields(fields, path):
+    if not isinstance(fields, dict):
+        raise ProfileError(f'{ path } must be an object of fields.')
+
+    for field_name, field in fields.items():
+        if not isinstance(field, dict) or field.get('type') not in FIELD_KEYS:
+            raise ProfileError(f'{ path }.{ field_name } must have a "type" out of { ", ".join(FIELD_KEYS) }.')
+
+        for key in FIELD_KEYS[field['type']]:
+            if key not in field:
+                raise ProfileError(f'{ path }.{ field_name } ({ field["type"] }) is missing "{ key }".')
+
+        if field['type'] == 'paragraph' and not isinstance(field['items'], list):
+            raise ProfileError(f'{ path }.{ field_name }.items must be a list.')
+
+def validate(data):
+    if not isinstance(data, dict):
+        raise ProfileError('Profile must be an object.')
+
+    for key in ('personal_information', 'employment_history', 'application_questions_1', 'application_questions_2', 'agreements'):
+        if key not in data:
+            raise ProfileError(f'Profile is missing "{ key }".')
+
+    validate_fields(data['personal_information'], 'personal_information')
+    validate_fields(data['agreements'], 'agreements')
+
+    if not isinstance(data['employment_history'], list):
+        raise ProfileError('employment_history must be a list.')
+
+    for index, experience in enumerate(data['employment_history']):
+        validate_fields(experience, f'employment_history[{ index }]')
+
+    for key in ('application_questions_1', 'application_questions_2'):
+        if not isinstance(data[key], dict):
+            raise ProfileError(f'{ key } must be an object.')
+
+    for question_name, question in data['application_questions_1'].items():
+        if not isinstance(question, dict) or 'context' not in question:
+            raise ProfileError(f'application_questions_1.{ question_name } must be an object with "context".')
+
+    for week_key, week in data['application_questions_2'].items():
+        if week_key == 'Overall':
+            if not isinstance(week, dict) or 'context' not in week:
+                raise ProfileError('application_questions_2.Overall must be an object with "context".')
+        elif not isinstance(week, dict):
+            raise ProfileError(f'application_questions_2.{ week_key } must be an object of days.')
+
+#endregion
+
+@dataclass(frozen = True)
+class CandidateProfile:
+    personal_information: MappingProxyType
+    employment_history: tuple
+    application_questions_1: MappingProxyType
+    application_questions_2: MappingProxyType
+    agreements: MappingProxyType
+    raw: MappingProxyType # The whole JSON, including the sections which aren't typed above.
+
+    @classmethod
+    def from_dict(cls, data):
+        validate(data)
+        frozen = freeze(data)
+
+        return cls(
+            personal_information = frozen['personal_information'],
+            employment_history = frozen['employment_history'],
+            application_questions_1 = frozen['application_questions_1'],
+            application_questions_2 = frozen['application_questions_2'],
+            agreements = frozen['agreements'],
+            raw = frozen,
+        )
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, 'r') as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ProfileError(f'Could not read the profile "{ path }": { e }') from e
+
+        return cls.from_dict(data)
+
+class ProfileStore:
+    # One store per profile file is shared by all the applications/workers in the process.
+    stores = dict()
+    stores_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+        # Loading eagerly so that a bad profile fails before any browser is started.
+        try:
+            self.mtime = os.stat(path).st_mtime
+        except OSError as e:
+            raise ProfileError(f'Could not read the profile "{ path }": { e }') from e
+
+        self.snapshot = CandidateProfile.load(path)
+
+    @classmethod
+    def shared(cls, path):
+        key = os.path.abspath(path)
+
+        with cls.stores_lock:
+            if key not in cls.stores:
+                cls.stores[key] = cls(path)
+
+            return cls.stores[key]
+
+    def current(self):
+        # Swapping in a new snapshot when the file was edited; meant to be called between two applications.
+        with self.lock:
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError:
+                return self.snapshot
+
+            if mtime != self.mtime:
+                self.mtime = mtime
+
+                try:
+                    self.snapshot = CandidateProfile.load(self.path)
+                    print(f'Reloaded the profile: { self.path }')
+                except ProfileError as pe: # Keeping the last good profile when the edit is broken.
+                    print('Keeping the previous profile:\n', pe)
+
+            return self.snapshot
@@ -0,0 +1,111 @@
+import os
+from selenium import webdriver
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+# URL patterns (Chrome DevTools `Network.setBlockedURLs` syntax) for each kind of resource which can be blocked.
+BLOCK_PATTERNS = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.ico', '*.svg'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m3u8'],
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*', '*hotjar.com*',
+        '*nr-data.net*', '*newrelic.com*', '*demdex.net*', '*omtrdc.net*', '*quantummetric.com*', '*adobedtm.com*',
+    ],
+}
+
+# Preset window sizes; headless browsers start with 800x600 otherwise, which switches Workday to its mobile layout.
+WINDOW_SIZES = {
+    'desktop': (1920, 1080),
+    'laptop': (1366, 768),
+    'compact': (1280, 800),
+}
+
+DEFAULT_BLOCK = 'images, fonts, media, trackers'
+
+def split_list(value):
+    if isinstance(value, (list, tuple)):
+        return [item.strip() for item in value if item.strip()]
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+class DriverOptions:
+    def __init__(self, browser = 'edge', driver_path = None, headless = False, block = DEFAULT_BLOCK, block_patterns = None, cache_dir = None, window_size = 'desktop'):
+        self.browser = browser.lower()
+        self.driver_path = driver_path
+        self.headless = headless
+        self.block = split_list(block)
+        self.block_patterns = split_list(block_patterns)
+        self.cache_dir = cache_dir
+        self.window_size = window_size
+
+    @classmethod
+    def from_config(cls, section, **overrides):
+        # `section` is either a `configparser` section (`config.ini`) or a plain mapping (the `browser` key of a YAML config).
+        section = section if section is not None else dict()
+        get_boolean = getattr(section, 'getboolean', None)
+
+        options = {
+            'browser': section.get('browser', 'edge'),
+            'driver_path': section.get('driver_path'),
+            'headless': get_boolean('headless', fallback = False) if get_boolean else bool(section.get('headless', False)),
+            'block': section.get('block', DEFAULT_BLOCK),
+            'block_patterns': section.get('block_patterns'),
+            'cache_dir': section.get('cache_dir'),
+            'window_size': section.get('window_size', 'desktop'),
+        }
+        options.update({ key: value for key, value in overrides.items() if value is not None })
+
+        return cls(**options)
+
+    def blocked_urls(self):
+        patterns = list(self.block_patterns)
+
+        for kind in self.block:
+            if kind not in BLOCK_PATTERNS:
+                raise ValueError(f'Unknown resource kind to block: { kind }. Expected one of { ", ".join(BLOCK_PATTERNS) }.')
+            patterns.extend(BLOCK_PATTERNS[kind])
+
+        return patterns
+
+def browser_options(options):
+    browser_options = webdriver.EdgeOptions() if options.browser == 'edge' else webdriver.ChromeOptions()
+
+    if options.headless:
+        browser_options.add_argument('--headless=new')
+
+    if options.window_size:
+        width, height = WINDOW_SIZES.get(options.window_size) or map(int, options.window_size.lower().split('x'))
+        browser_options.add_argument(f'--window-size={ width },{ height }')
+
+    if options.cache_dir:
+        # Keeping the static files of the portal on the disk between the sessions (and across the workers).
+        browser_options.add_argument(f'--disk-cache-dir={ os.path.abspath(options.cache_dir) }')
+
+    if 'images' in options.block:
+        # Not even decoding the images which slip through the URL patterns (e.g. served without an extension).
+        browser_options.add_experimental_option('prefs', { 'profile.managed_default_content_settings.images': 2 })
+
+    browser_options.add_argument('--disable-extensions')
+    browser_options.add_argument('--disable-background-networking')
+
+    return browser_options
+
+def create_driver(options):
+    # The single place where the browsers are started, for the Walmart class as well as for the YAML-driven runner.
+    if options.browser == 'edge':
+        service = EdgeService(executable_path = options.driver_path) if options.driver_path else EdgeService()
+        driver = webdriver.Edge(service = service, options = browser_options(options))
+    elif options.browser == 'chrome':
+        service = ChromeService(executable_path = options.driver_path) if options.driver_path else ChromeService()
+        driver = webdriver.Chrome(service = service, options = browser_options(options))
+    else:
+        raise ValueError(f'Unsupported browser: { options.browser }. Expected edge or chrome.')
+
+    blocked_urls = options.blocked_urls()
+
+    if blocked_urls:
+        # Both Chrome and Edge are Chromium based, so the requests can be blocked through the DevTools protocol.
+        driver.execute_cdp_cmd('Network.enable', dict())
+        driver.execute_cdp_cmd('Network.setBlockedURLs', { 'urls': blocked_urls })
+
+    return driver
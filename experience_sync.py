@@ -0,0 +1,72 @@
+import re
+
+# Reads every work-experience panel in one round-trip: its element and the values of its fields by their automation ID.
+# The start and end dates share one automation ID, so every ID maps to the list of the values in the order of the page.
+READ_PANELS_SCRIPT = """
+var panels = document.querySelectorAll(arguments[0]);
+var result = [];
+
+for (var i = 0; i < panels.length; i++) {
+    var values = {};
+    var fields = panels[i].querySelectorAll('[data-automation-id]');
+
+    for (var j = 0; j < fields.length; j++) {
+        var field = fields[j];
+        var id = field.getAttribute('data-automation-id');
+        var value;
+
+        if (field.type === 'checkbox' || field.type === 'radio') {
+            value = field.checked;
+        } else if (field.tagName === 'INPUT' || field.tagName === 'TEXTAREA') {
+            value = field.value;
+        } else if (field.tagName === 'BUTTON') {
+            value = field.textContent.trim();
+        } else {
+            continue;
+        }
+
+        (values[id] = values[id] || []).push(value);
+    }
+
+    result.push({ element: panels[i], values: values });
+}
+
+return result;
+"""
+
+def digits(value):
+    # Dates are typed as "MMYYYY" but shown formatted (e.g. "01/2020"), so only their digits are compared.
+    return re.sub(r'\D', '', str(value))
+
+def field_matches(field_name, field, values):
+    # Whether the panel already holds the profile's value of the field.
+    current = values.get(field['location'], list())
+
+    if field['type'] == 'text':
+        return bool(current) and current[0] == str(field['value'])
+
+    if field['type'] == 'paragraph':
+        return bool(current) and current[0].strip() == '\n'.join(field['items']).strip()
+
+    if field['type'] == 'dropdown':
+        return bool(current) and current[0] == str(field['value'])
+
+    if field['type'] in ('checkbox', 'radio'):
+        return bool(current) and current[0] is True
+
+    if field['type'] == 'date':
+        if field_name[ : 3] == 'end' and field['value'] == 'present':
+            return values.get('currentlyWorkHere', [False])[0] is True
+
+        index = 1 if field_name[ : 3] == 'end' else 0
+        return len(current) > index and digits(current[index]) == digits(field['value'])
+
+    return False
+
+def differing_fields(experience, values):
+    # The fields of a profile's experience which the panel doesn't hold yet, in their order.
+    return { field_name: field for field_name, field in experience.items() if not field_matches(field_name, field, values) }
+
+def read_panels(driver, selector):
+    # `selector` matches the panels (the `experience_panel` locator).
+    return driver.execute_script(READ_PANELS_SCRIPT, selector)
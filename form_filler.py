@@ -0,0 +1,81 @@
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException
+
+# Field types which can be filled by the injected script; the others (dropdowns, dates) need real clicks/typing.
+BATCH_TYPES = ('text', 'paragraph', 'checkbox', 'radio')
+
+# The native value setter is used, as React ignores a plain `.value` assignment without its own input/change events.
+SET_VALUE_SCRIPT = """
+function setValue(element, value) {
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : element instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+    element.dispatchEvent(new Event('blur', { bubbles: true }));
+}
+"""
+
+# Fills all of the fields in one round-trip and reports the status of each of them.
+# The values are passed as arguments (never interpolated), so quotes in them are safe.
+BATCH_FILL_SCRIPT = SET_VALUE_SCRIPT + """
+var root = arguments[0] || document;
+var fields = arguments[1];
+var report = {};
+
+for (var name in fields) {
+    var field = fields[name];
+    var element = root.querySelector('[data-automation-id="' + CSS.escape(field.location) + '"]');
+
+    if (!element) {
+        report[name] = 'missing';
+        continue;
+    }
+
+    try {
+        if (field.type === 'text') {
+            setValue(element, field.value);
+            report[name] = element.value === String(field.value) ? 'filled' : 'rejected';
+        } else if (field.type === 'paragraph') {
+            setValue(element, field.items.join('\\n'));
+            report[name] = 'filled';
+        } else if (field.type === 'checkbox') {
+            if (!element.checked) {
+                element.click();
+            }
+            report[name] = element.checked ? 'filled' : 'rejected';
+        } else if (field.type === 'radio') {
+            element.click();
+            report[name] = 'filled';
+        } else {
+            report[name] = 'unsupported';
+        }
+    } catch (error) {
+        report[name] = 'error: ' + error.message;
+    }
+}
+return report;
+"""
+
+def batch_fill(driver, fields):
+    # `driver` is either the WebDriver or a WebElement (e.g. a work-experience panel) to search the fields in.
+    if isinstance(driver, WebElement):
+        root, driver = driver, driver.parent
+    else:
+        root = None
+
+    batch_fields = {
+        field_name: { key: (list(value) if isinstance(value, tuple) else value) for key, value in field.items() }
+        for field_name, field in fields.items() if field['type'] in BATCH_TYPES
+    }
+
+    report = { field_name: 'unsupported' for field_name in fields if field_name not in batch_fields }
+
+    if batch_fields:
+        try:
+            report.update(driver.execute_script(BATCH_FILL_SCRIPT, root, batch_fields))
+        except WebDriverException as wde: # Falling back to the element-by-element filling for all of them.
+            print('WebDriverException - Batch Fill:\n', wde)
+            report.update({ field_name: 'error' for field_name in batch_fields })
+
+    return report
@@ -0,0 +1,84 @@
+from collections import namedtuple
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from tracing import TracedWebDriverWait as WebDriverWait
+
+# Constants
+WAIT_TIME = 30  # Common wait time.
+MAX_PAGES = 100  # Safety limit in case the "next" button never gets disabled.
+
+# Lightweight job record, free of any `WebElement` so that it can't go stale while the driver is on another tab.
+JobRecord = namedtuple('JobRecord', ['job_id', 'title', 'link', 'location', 'posted_date'])
+
+# Reads every job of the current results page in one round-trip.
+READ_PAGE_SCRIPT = """
+var jobs = [];
+var items = document.querySelectorAll('ul[aria-label^="Page"] > li');
+
+function text(item, selector) {
+    var element = item.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+}
+
+for (var i = 0; i < items.length; i++) {
+    var title = items[i].querySelector('a[data-automation-id="jobTitle"]');
+    if (!title) {
+        continue; // Broken entries on the portal are skipped, as before.
+    }
+
+    jobs.push({
+        job_id: text(items[i], 'ul[data-automation-id="subtitle"] li'),
+        title: title.innerText.trim(),
+        link: title.href,
+        location: text(items[i], '[data-automation-id="locations"] dd') || text(items[i], '[data-automation-id="locations"]'),
+        posted_date: text(items[i], '[data-automation-id="postedOn"] dd') || text(items[i], '[data-automation-id="postedOn"]')
+    });
+}
+return jobs;
+"""
+
+NEXT_PAGE_SELECTOR = 'nav[aria-label="pagination"] button[aria-label="next"], button[data-uxi-widget-type="stepToNextButton"]'
+
+def read_page(driver):
+    WebDriverWait(driver, WAIT_TIME).until(
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul[aria-label^="Page"] > li'))
+    )
+
+    return [
+        # The requisition ID is used as the job's identity, falling back to its link.
+        JobRecord(job['job_id'] or job['link'], job['title'], job['link'], job['location'], job['posted_date'])
+        for job in driver.execute_script(READ_PAGE_SCRIPT)
+    ]
+
+def go_to_next_page(driver):
+    next_buttons = driver.find_elements(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)
+
+    if not next_buttons or not next_buttons[0].is_enabled() or next_buttons[0].get_attribute('aria-disabled') == 'true':
+        return False
+
+    # The list is replaced on navigation, so the old one going stale tells that the next page is there.
+    current_list = driver.find_element(By.CSS_SELECTOR, 'ul[aria-label^="Page"]')
+    driver.execute_script("arguments[0].click();", next_buttons[0])
+
+    try:
+        WebDriverWait(driver, WAIT_TIME).until(EC.staleness_of(current_list))
+    except TimeoutException:
+        print('The next results page did not load.')
+        return False
+
+    return True
+
+def discover_job_pages(driver, max_pages = MAX_PAGES):
+    # Generator walking all of the results pages and yielding the new jobs of each of them as a list.
+    seen_job_ids = set()
+
+    for page_number in range(1, max_pages + 1):
+        jobs = [job for job in read_page(driver) if job.job_id not in seen_job_ids]
+        seen_job_ids.update(job.job_id for job in jobs)
+
+        print(f'Discovered { len(jobs) } jobs on page { page_number }.')
+        yield jobs
+
+        if not go_to_next_page(driver):
+            break
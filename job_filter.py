@@ -0,0 +1,97 @@
+import re
+from collections import Counter
+from driver_factory import split_list
+from posting_tracker import posted_days_ago, UNKNOWN_AGE
+
+# Store numbers in the location text, e.g. "Walmart Supercentre #1234 - North York, ON".
+STORE_ID_PATTERN = re.compile(r'#?\b(\d{3,5})\b')
+
+def combine(patterns):
+    # All of the patterns as one case-insensitive alternation, so that a title is checked against them in a single search.
+    return re.compile('|'.join(f'(?:{ pattern })' for pattern in patterns), re.IGNORECASE) if patterns else None
+
+class JobFilter:
+    # Rules deciding, before any tab is opened, which of the discovered jobs are worth applying to.
+    # Every kind of rule is compiled once: the patterns into one regular expression each and the store IDs into sets.
+    def __init__(self, include_titles = None, exclude_titles = None, include_locations = None, exclude_locations = None,
+                 store_ids = None, exclude_store_ids = None, employment_types = None, max_posted_days = None):
+        self.include_titles = combine(split_list(include_titles))
+        self.exclude_titles = combine(split_list(exclude_titles))
+        self.include_locations = combine(split_list(include_locations))
+        self.exclude_locations = combine(split_list(exclude_locations))
+        self.store_ids = set(split_list(store_ids))
+        self.exclude_store_ids = set(split_list(exclude_store_ids))
+        self.employment_types = combine(split_list(employment_types))
+        self.max_posted_days = max_posted_days
+
+        self.rejected = Counter() # Rule -> number of the jobs it rejected so far.
+
+    @classmethod
+    def from_config(cls, section):
+        # `section` is the `[filters]` section of `config.ini`, or `None` for no filtering.
+        section = section if section is not None else dict()
+        max_posted_days = section.get('max_posted_days')
+
+        return cls(
+            include_titles = section.get('include_titles'),
+            exclude_titles = section.get('exclude_titles'),
+            include_locations = section.get('include_locations'),
+            exclude_locations = section.get('exclude_locations'),
+            store_ids = section.get('store_ids'),
+            exclude_store_ids = section.get('exclude_store_ids'),
+            employment_types = section.get('employment_types'),
+            max_posted_days = int(max_posted_days) if max_posted_days else None,
+        )
+
+    def rejection(self, job):
+        # Name of the first rule the job fails, or `None` when it passes all of them.
+        title = job.title or ''
+        location = job.location or ''
+
+        if self.include_titles and not self.include_titles.search(title):
+            return 'include_titles'
+
+        if self.exclude_titles and self.exclude_titles.search(title):
+            return 'exclude_titles'
+
+        if self.include_locations and not self.include_locations.search(location):
+            return 'include_locations'
+
+        if self.exclude_locations and self.exclude_locations.search(location):
+            return 'exclude_locations'
+
+        if self.store_ids or self.exclude_store_ids:
+            job_store_ids = set(STORE_ID_PATTERN.findall(location))
+
+            if self.store_ids and not (job_store_ids & self.store_ids):
+                return 'store_ids'
+
+            if job_store_ids & self.exclude_store_ids:
+                return 'exclude_store_ids'
+
+        # The listings show the time type only as a part of the title, e.g. "Cashier - Part Time".
+        if self.employment_types and not self.employment_types.search(title):
+            return 'employment_types'
+
+        # The postings without a readable date are kept.
+        if self.max_posted_days is not None:
+            days = posted_days_ago(job.posted_date)
+
+            if days != UNKNOWN_AGE and days > self.max_posted_days:
+                return 'max_posted_days'
+
+        return None
+
+    def filter(self, jobs):
+        # Evaluating a whole listing page in one pass, keeping the order of the jobs.
+        kept_jobs = list()
+
+        for job in jobs:
+            rule = self.rejection(job)
+
+            if rule:
+                self.rejected[rule] += 1
+            else:
+                kept_jobs.append(job)
+
+        return kept_jobs
@@ -0,0 +1,94 @@
+import json
+from abc import ABC, abstractmethod
+from urllib.parse import urlparse
+import urllib3
+from job_discovery import JobRecord, discover_job_pages
+
+# Constants
+PAGE_SIZE = 20  # Workday doesn't return more than 20 postings per request.
+MAX_PAGES = 100  # Safety limit for the paging.
+REQUEST_TIMEOUT = 30  # Seconds.
+
+class JobSource(ABC):
+    # A source yields the jobs of a search page by page, as lists of `JobRecord`.
+    @abstractmethod
+    def pages(self):
+        pass
+
+class BrowserJobSource(JobSource):
+    # Scraping the results pages rendered in an already searched browser session.
+    def __init__(self, driver, max_pages = MAX_PAGES):
+        self.driver = driver
+        self.max_pages = max_pages
+
+    def pages(self):
+        return discover_job_pages(self.driver, self.max_pages)
+
+class WorkdayJobSource(JobSource):
+    # Fetching the postings from Workday's own JSON search API, without rendering any page.
+    def __init__(self, jobs_url, applied_facets = None, search_text = '', endpoint = None, page_size = PAGE_SIZE, max_pages = MAX_PAGES, pool = None):
+        self.jobs_url = jobs_url.rstrip('/')
+        self.applied_facets = applied_facets or dict()
+        self.search_text = search_text
+        self.endpoint = endpoint or self.endpoint_for(self.jobs_url)
+        self.page_size = page_size
+        self.max_pages = max_pages
+
+        # Connections are kept alive and re-used across the pages (and the polls).
+        self.pool = pool or urllib3.PoolManager(maxsize = 4, retries = urllib3.Retry(total = 3, backoff_factor = 0.5, status_forcelist = (429, 502, 503, 504), allowed_methods = None))
+
+    def endpoint_for(self, jobs_url):
+        # https://<tenant>.wd5.myworkdayjobs.com[/<locale>]/<site> -> https://<tenant>.wd5.myworkdayjobs.com/wday/cxs/<tenant>/<site>/jobs
+        parts = urlparse(jobs_url)
+        tenant = parts.netloc.split('.')[0]
+        site = parts.path.rstrip('/').split('/')[-1]
+
+        return f'{ parts.scheme }://{ parts.netloc }/wday/cxs/{ tenant }/{ site }/jobs'
+
+    def fetch(self, offset):
+        body = {
+            'appliedFacets': self.applied_facets,
+            'limit': self.page_size,
+            'offset': offset,
+            'searchText': self.search_text,
+        }
+
+        response = self.pool.request(
+            'POST', self.endpoint,
+            body = json.dumps(body),
+            headers = { 'Content-Type': 'application/json', 'Accept': 'application/json' },
+            timeout = REQUEST_TIMEOUT
+        )
+
+        if response.status != 200:
+            raise RuntimeError(f'Job search failed with HTTP { response.status }: { response.data[ : 200] }')
+
+        return json.loads(response.data)
+
+    def record(self, posting):
+        # The requisition ID is the first of the bullet fields, e.g. "R-1234567".
+        bullet_fields = posting.get('bulletFields') or [None]
+        link = f"{ self.jobs_url }{ posting['externalPath'] }"
+
+        return JobRecord(bullet_fields[0] or link, posting['title'], link, posting.get('locationsText'), posting.get('postedOn'))
+
+    def pages(self):
+        seen_job_ids = set()
+        offset, total = 0, 0
+
+        for page_number in range(1, self.max_pages + 1):
+            data = self.fetch(offset)
+            postings = data.get('jobPostings') or []
+
+            jobs = [job for job in map(self.record, postings) if job.job_id not in seen_job_ids]
+            seen_job_ids.update(job.job_id for job in jobs)
+
+            print(f'Fetched { len(jobs) } jobs on page { page_number }.')
+            yield jobs
+
+            # Workday only reports the total on the first page.
+            offset += len(postings)
+            total = data.get('total') or total
+
+            if not postings or offset >= total:
+                break
@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+# Outcomes after which a job is never opened again; the others (partial, failed, skipped) are retried on the next run.
+FINAL_STATUSES = ('submitted', 'already_submitted', 'not_available')
+
+# SQLite limits the number of the parameters in a single query.
+QUERY_CHUNK_SIZE = 500
+
+class ApplicationLedger:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+        # Every worker has its own connection; SQLite serializes the writes between them.
+        self.connection = sqlite3.connect(path, timeout = 30, check_same_thread = False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS applications (
+                job_key TEXT PRIMARY KEY,
+                job_id TEXT,
+                title TEXT,
+                link TEXT,
+                status TEXT NOT NULL,
+                step TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 1,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        self.connection.commit()
+
+    def job_key(self, job):
+        # The requisition ID identifies a job; the link is used for the jobs which don't show it.
+        return job.job_id or job.link
+
+    def record(self, job, status, step = None, error = None):
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        with self.lock:
+            self.connection.execute('''
+                INSERT INTO applications (job_key, job_id, title, link, status, step, error, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_key) DO UPDATE SET
+                    status = excluded.status, step = excluded.step, error = excluded.error,
+                    attempts = attempts + 1, updated_at = excluded.updated_at
+            ''', (self.job_key(job), job.job_id, job.title, job.link, status, step, error, now, now))
+            self.connection.commit()
+
+    def statuses(self, jobs):
+        # Looking up a whole page of jobs in bulk, returning the job key -> status of the known ones.
+        keys = list({ self.job_key(job) for job in jobs })
+        statuses = dict()
+
+        with self.lock:
+            for index in range(0, len(keys), QUERY_CHUNK_SIZE):
+                chunk = keys[index : index + QUERY_CHUNK_SIZE]
+                rows = self.connection.execute(
+                    f'SELECT job_key, status FROM applications WHERE job_key IN ({ ", ".join("?" * len(chunk)) })', chunk
+                )
+                statuses.update(rows)
+
+        return statuses
+
+    def unfinished(self, jobs):
+        # Filtering out the jobs which were already submitted (or can't be applied anymore) in the past runs.
+        statuses = self.statuses(jobs)
+        return [job for job in jobs if statuses.get(self.job_key(job)) not in FINAL_STATUSES]
@@ -0,0 +1,138 @@
+import os
+import json
+import threading
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException
+
+# Constants
+LOCATE_TIME = 30  # Seconds to wait for any of an element's selectors to match.
+XPATH_PREFIX = 'xpath:'  # Selectors of the registry are CSS unless they start with this.
+LOCATORS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locators.json')
+
+class LocatorStats:
+    # Hits and misses of every selector, persisted between the runs to spot the ones which went stale.
+    # One object per file is shared by all the workers of the process.
+    stats = dict()
+    stats_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.counts = dict() # Name -> selector -> { hits, misses, last_hit }
+
+        if path and os.path.exists(path):
+            with open(path, 'r') as file:
+                self.counts = json.load(file)
+
+    @classmethod
+    def shared(cls, path):
+        key = os.path.abspath(path) if path else None
+
+        with cls.stats_lock:
+            if key not in cls.stats:
+                cls.stats[key] = cls(path)
+
+            return cls.stats[key]
+
+    def record(self, name, selector, is_hit):
+        with self.lock:
+            counts = self.counts.setdefault(name, dict()).setdefault(selector, { 'hits': 0, 'misses': 0, 'last_hit': None })
+
+            if is_hit:
+                counts['hits'] += 1
+                counts['last_hit'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            else:
+                counts['misses'] += 1
+
+    def stale(self):
+        # Selectors which missed and never matched since the statistics were started.
+        with self.lock:
+            return {
+                name: [selector for selector, counts in selectors.items() if counts['misses'] and not counts['hits']]
+                for name, selectors in self.counts.items()
+                if any(counts['misses'] and not counts['hits'] for counts in selectors.values())
+            }
+
+    def save(self):
+        if self.path:
+            with self.lock, open(self.path, 'w') as file:
+                json.dump(self.counts, file, indent = 4)
+
+class Locators:
+    # Registry of the page elements: each logical name has an ordered ladder of selectors (in `locators.json`),
+    # all of which are probed in one round-trip, so that a broken selector falls over to the next one right away.
+    def __init__(self, waits, path = LOCATORS_PATH, stats_path = None):
+        self.waits = waits
+
+        with open(path, 'r') as file:
+            self.ladders = json.load(file)
+
+        self.stats = LocatorStats.shared(stats_path)
+        self.winners = dict() # Name -> the selector which matched last in this session; probed first the next time.
+
+    def outcome(self, selector, present):
+        if selector.startswith(XPATH_PREFIX):
+            return ('xpath', selector[len(XPATH_PREFIX) : ])
+
+        return ('present' if present else 'css', selector)
+
+    def selectors(self, name):
+        # The ladder of the name, with the selector which matched last moved to the front.
+        ladder = self.ladders[name]
+        winner = self.winners.get(name)
+        return [winner] + [selector for selector in ladder if selector != winner] if winner else ladder
+
+    def css(self, name):
+        # All of the CSS selectors of an element as one selector list, for the expected conditions and the scoped look-ups.
+        return ', '.join(selector for selector in self.ladders[name] if not selector.startswith(XPATH_PREFIX))
+
+    def race(self, driver, step, outcomes, timeout = LOCATE_TIME, present = ()):
+        # Same as `AdaptiveWait.race()`, but an outcome may also be a name of the registry (probing its whole ladder),
+        # in which case the selector which decided the branch is counted. `present` lists the outcomes whose element
+        # only needs to be in the page (e.g. a hidden file input).
+        alternatives = dict()
+
+        for outcome, locator in outcomes.items():
+            if isinstance(locator, str):
+                for selector in self.selectors(locator):
+                    alternatives[f'{ outcome }:{ selector }'] = self.outcome(selector, outcome in present)
+            else:
+                alternatives[outcome] = locator
+
+        key, element = self.waits.race(driver, step, alternatives, timeout)
+        outcome, _, selector = key.partition(':')
+
+        if selector:
+            self.hit(outcomes[outcome], selector)
+
+        return outcome, element
+
+    def hit(self, name, selector):
+        # The selectors probed before the one which matched have missed.
+        ladder = self.ladders[name]
+        winner = self.winners.get(name)
+        selectors = self.selectors(name)
+
+        for missed_selector in selectors[ : selectors.index(selector)]:
+            self.stats.record(name, missed_selector, False)
+
+        self.stats.record(name, selector, True)
+
+        if selector != ladder[0] and winner != selector:
+            print(f'Locator "{ name }" fell back to: { selector }')
+
+        self.winners[name] = selector
+
+    def find(self, driver, name, timeout = LOCATE_TIME, present = False):
+        # The first usable element (or only present, with `present`) matching any of the selectors of the name.
+        try:
+            _, element = self.race(driver, f'locate.{ name }', { name: name }, timeout, (name,) if present else ())
+        except TimeoutException:
+            ladder = self.ladders[name]
+
+            for selector in ladder:
+                self.stats.record(name, selector, False)
+
+            raise TimeoutException(f'None of the selectors of "{ name }" matched: { ladder }')
+
+        return element
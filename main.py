@@ -1,32 +1,33 @@
+import sys
 import utils
+from selenium.webdriver.common.by import By
 
-def main():
-    company = "walmart"  # or "lcbo" or any other company
+def apply(company, credentials):
     config = utils.load_config(company)
-    credentials = utils.load_credentials()
-    driver = utils.get_driver()
-    
-    # Assuming the login URL is part of the config
-    driver.get(config['login_url'])
-    
-    # Perform login
-    driver.find_element_by_id("username").send_keys(credentials[company]['username'])
-    driver.find_element_by_id("password").send_keys(credentials[company]['password'])
-    driver.find_element_by_id("login-button").click()
-    
-    # Perform steps from the config
-    for step in config['steps']:
-        value = None
-        if 'value' in step:
-            value = step['value']
-        utils.perform_action(driver, step, value)
-    
-    # Answer questions
-    for q in config['questions']:
-        # Code to handle questions
-        pass
-    
-    driver.quit()
+
+    # Compiling the steps (cached by the YAML's hash) and resolving the templates before the browser starts.
+    plan = utils.load_plan(company)
+    context = utils.load_profile_context(config['profile']) if 'profile' in config else dict()
+    plan.check(context)
+
+    driver = utils.get_driver(config)
+
+    try:
+        # Assuming the login URL is part of the config
+        driver.get(config['login_url'])
+
+        # Perform login
+        driver.find_element(By.ID, "username").send_keys(credentials[company]['username'])
+        driver.find_element(By.ID, "password").send_keys(credentials[company]['password'])
+        driver.find_element(By.ID, "login-button").click()
+
+        # Perform steps and answer questions from the config
+        plan.run(driver, context)
+    finally:
+        driver.quit()
+
+def main(company = "walmart"):  # or "lcbo" or any other company
+    apply(company, utils.load_credentials())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:])
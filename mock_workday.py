@@ -0,0 +1,391 @@
+import re
+import sys
+import json
+import random
+import threading
+from html import escape
+from time import sleep
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Constants
+JOBS_PER_PAGE = 20
+SEARCH_API_PATH = '/wday/cxs/mock/jobs/jobs'  # Workday's JSON job search, for the `workday` job source.
+JOB_TITLES = ['Cashier', 'Stocker', 'Sales Associate', 'Cart Attendant', 'Deli Associate', 'Overnight Stocker']
+
+# Order of the application pages after the job posting, same as in `WalmartJobApplication.apply_job`.
+APPLY_STEPS = ['upload', 'personal', 'experience', 'questions_1', 'questions_2', 'agreements', 'review', 'submitted']
+
+# Behaviour shared by all pages: delayed (SPA-like) rendering of the content, a background XHR, and the widgets.
+# The handlers are delegated from the document as the content is rendered with `innerHTML`.
+PAGE_SCRIPT = """
+var root = document.getElementById('root');
+setTimeout(function () {
+    root.innerHTML = document.getElementById('content').innerHTML;
+    fetch('/api/ready');
+}, RENDER_DELAY);
+
+function go(url) {
+    // Like the portal: the page is saved by a request under a loading mask, and only then the next one is loaded.
+    var mask = document.createElement('div');
+    mask.setAttribute('data-automation-id', 'loadingMask');
+    document.body.appendChild(mask);
+
+    fetch('/api/save').then(function () {
+        window.location.href = url;
+    });
+}
+
+document.addEventListener('click', function (event) {
+    var target = event.target.closest('[data-action]');
+    if (!target) {
+        return;
+    }
+    var action = target.getAttribute('data-action');
+
+    if (action === 'go') {
+        go(target.getAttribute('data-href'));
+    } else if (action === 'referral') {
+        document.querySelector('[data-automation-id="sourceMenu"]').innerHTML =
+            '<div data-automation-id="promptOption" data-action="prompt" tabindex="0">I know someone who works here</div>';
+    } else if (action === 'prompt') {
+        document.querySelector('[data-automation-id="sourceMenu"]').remove();
+        document.getElementById('referralBox').innerHTML = '<input data-automation-id="referral">';
+    } else if (action === 'dropdown') {
+        target.nextElementSibling.style.display = 'block';
+    } else if (action === 'option') {
+        target.closest('ul').style.display = 'none';
+        target.closest('ul').previousElementSibling.textContent = target.textContent;
+    } else if (action === 'delete') {
+        target.closest('[data-automation-id^="workExperience-"]').remove();
+    } else if (action === 'add') {
+        var panels = document.getElementById('panels');
+        var panel = document.createElement('div');
+        panel.setAttribute('data-automation-id', 'workExperience-' + (panels.children.length + 1));
+        panel.innerHTML = document.getElementById('panelTemplate').innerHTML;
+        panels.appendChild(panel);
+        target.setAttribute('data-automation-id', 'Add Another');
+    }
+});
+
+document.addEventListener('keydown', function (event) {
+    var target = event.target;
+    if (event.key === 'Enter' && target.getAttribute('data-automation-id') === 'sourceSearch') {
+        document.querySelector('[data-automation-id="sourceMenu"]').innerHTML =
+            '<div data-automation-label="Referral" data-action="referral" tabindex="0">Referral</div>';
+    }
+    if (event.key === ' ' && target.getAttribute('data-action') === 'go') {
+        target.click();
+    }
+});
+
+document.addEventListener('change', function (event) {
+    if (event.target.getAttribute('data-automation-id') === 'file-upload-input-ref') {
+        setTimeout(function () {
+            document.getElementById('uploads').innerHTML = '<div data-automation-id="file-upload-item">' + event.target.files[0].name + '</div>';
+        }, RENDER_DELAY);
+    }
+});
+"""
+
+def page(title, content, render_delay):
+    # The content is kept in an inert <template> and rendered after the delay, like the Workday SPA does.
+    return f'''<!DOCTYPE html>
+<html>
+<head><title>{ escape(title) }</title></head>
+<body>
+<div id="root"></div>
+<template id="content">{ content }</template>
+<script>{ PAGE_SCRIPT.replace('RENDER_DELAY', str(render_delay)) }</script>
+</body>
+</html>'''
+
+#region Form Fields
+
+def field_html(field_name, field, rendered_locations):
+    location = escape(field['location'])
+
+    if field['type'] == 'text':
+        return f'<label>{ escape(field_name) }<input data-automation-id="{ location }"></label>'
+
+    if field['type'] == 'paragraph':
+        return f'<label>{ escape(field_name) }<textarea data-automation-id="{ location }"></textarea></label>'
+
+    if field['type'] == 'dropdown':
+        return (
+            f'<label>{ escape(field_name) }<button type="button" data-automation-id="{ location }" data-action="dropdown">Select One</button>'
+            f'<ul style="display: none"><li data-value="{ escape(str(field["key"])) }" data-action="option"><div>{ escape(str(field["value"])) }</div></li></ul></label>'
+        )
+
+    if field['type'] in ('radio', 'checkbox'):
+        return f'<label><input type="{ field["type"] }" data-automation-id="{ location }">{ escape(field_name) }</label>'
+
+    if field['type'] == 'date':
+        # The start and end dates share the same automation ID, so both of them are rendered once for the first date field.
+        if field['location'] in rendered_locations:
+            return ''
+        rendered_locations.add(field['location'])
+
+        return (
+            f'<label>From<input data-automation-id="{ location }"></label>'
+            f'<label>To<input data-automation-id="{ location }"></label>'
+            '<label><input type="checkbox" data-automation-id="currentlyWorkHere">I currently work here</label>'
+        )
+
+    return ''
+
+def fields_html(fields):
+    rendered_locations = set()
+    return ''.join(field_html(field_name, field, rendered_locations) for field_name, field in fields.items())
+
+#endregion
+
+class MockWorkday:
+    def __init__(self, profile, jobs = 45, latency = 0.05, jitter = 0.05, render_delay = 150, flaky_rate = 0.0, continue_rate = 0.2, seed = 0):
+        # `profile` is the candidate profile JSON; the forms are generated with the same `data-automation-id`s it fills.
+        self.profile = profile
+        self.latency = latency # Seconds added by the server to every response.
+        self.jitter = jitter # Random extra seconds (0 to `jitter`) on top of the latency.
+        self.render_delay = render_delay # Milliseconds the page waits before rendering its content.
+        self.flaky_rate = flaky_rate # Share of the page requests answered with a 503.
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+        # Every `1 / continue_rate`-th job was already started in the past, so it shows "Continue Application".
+        continue_every = round(1 / continue_rate) if continue_rate else 0
+        self.jobs = [
+            {
+                'id': f'R-{ 1000 + index }',
+                'title': JOB_TITLES[index % len(JOB_TITLES)],
+                'continue': bool(continue_every) and index % continue_every == continue_every - 1,
+            }
+            for index in range(jobs)
+        ]
+        self.submitted = set()
+
+        self.server = None
+
+    #region Server
+
+    def start(self, port = 0):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                mock.handle(self)
+
+            def do_POST(self):
+                mock.handle_search(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # The browser drops the requests of the pages it leaves (e.g. a prefetched tab being re-used).
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self.server = Server(('127.0.0.1', port), Handler)
+        threading.Thread(target = self.server.serve_forever, daemon = True).start()
+
+        return f'http://127.0.0.1:{ self.server.server_port }'
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def delay(self):
+        with self.random_lock:
+            extra = self.random.uniform(0, self.jitter)
+            is_flaky = self.random.random() < self.flaky_rate
+
+        sleep(self.latency + extra)
+        return is_flaky
+
+    def handle(self, request):
+        url = urlparse(request.path)
+        query = parse_qs(url.query)
+        is_flaky = self.delay()
+
+        if url.path.startswith('/api/'):
+            return self.respond(request, 200, json.dumps({ 'ready': True }), 'application/json')
+
+        if is_flaky:
+            return self.respond(request, 503, page('Service Unavailable', '<h1>Service Unavailable</h1>', 0))
+
+        routes = [
+            (r'/login', self.login_page),
+            (r'/userHome', self.user_home_page),
+            (r'/jobs', self.jobs_page),
+            (r'/jobs/job/(R-\d+)', self.job_page),
+            (r'/job/(R-\d+)/apply/(\w+)', self.apply_page),
+        ]
+
+        for pattern, handler in routes:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                return self.respond(request, 200, handler(query, *match.groups()))
+
+        self.respond(request, 404, page('Not Found', '<h1>Not Found</h1>', 0))
+
+    def handle_search(self, request):
+        # The JSON search API: a page of postings by `offset` and `limit`; like Workday, the total is sent on the first page only.
+        body = json.loads(request.rfile.read(int(request.headers.get('Content-Length', 0))) or b'{}')
+        is_flaky = self.delay()
+
+        if request.path != SEARCH_API_PATH:
+            return self.respond(request, 404, json.dumps({ 'error': 'Not Found' }), 'application/json')
+
+        if is_flaky:
+            return self.respond(request, 503, json.dumps({ 'error': 'Service Unavailable' }), 'application/json')
+
+        offset, limit = body.get('offset', 0), min(body.get('limit', JOBS_PER_PAGE), JOBS_PER_PAGE)
+        postings = [
+            {
+                'title': job['title'],
+                'externalPath': f"/job/{ job['id'] }",
+                'locationsText': 'North York, ON',
+                'postedOn': 'Posted Today',
+                'bulletFields': [job['id']],
+            }
+            for job in self.jobs[offset : offset + limit]
+        ]
+
+        self.respond(request, 200, json.dumps({ 'total': len(self.jobs) if offset == 0 else 0, 'jobPostings': postings }), 'application/json')
+
+    def respond(self, request, status, body, content_type = 'text/html; charset=utf-8'):
+        data = body.encode()
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    #endregion
+
+    #region Pages
+
+    def navigation(self, next_url, back = True):
+        back_button = '<button type="button" data-automation-id="bottom-navigation-back-button">Back</button>' if back else ''
+        return f'{ back_button }<button type="button" data-automation-id="bottom-navigation-next-button" data-action="go" data-href="{ next_url }">Save and Continue</button>'
+
+    def login_page(self, query):
+        content = '''
+            <input data-automation-id="email">
+            <input data-automation-id="password" type="password">
+            <div data-automation-id="click_filter" data-action="go" data-href="/userHome" tabindex="0">Sign In</div>
+        '''
+        return page('Sign In', content, self.render_delay)
+
+    def user_home_page(self, query):
+        return page('Home', '<h1>Welcome</h1><a href="/jobs">Jobs</a>', self.render_delay)
+
+    def jobs_page(self, query):
+        page_number = int(query.get('page', ['1'])[0])
+        page_count = max(1, -(-len(self.jobs) // JOBS_PER_PAGE))
+        jobs = self.jobs[(page_number - 1) * JOBS_PER_PAGE : page_number * JOBS_PER_PAGE]
+
+        items = ''.join(
+            f'''<li>
+                <a data-automation-id="jobTitle" href="/jobs/job/{ job['id'] }">{ escape(job['title']) }</a>
+                <div data-automation-id="locations"><dd>North York, ON</dd></div>
+                <div data-automation-id="postedOn"><dd>Posted Today</dd></div>
+                <ul data-automation-id="subtitle"><li>{ job['id'] }</li></ul>
+            </li>'''
+            for job in jobs
+        )
+
+        next_button = (
+            f'<button type="button" aria-label="next" data-action="go" data-href="/jobs?page={ page_number + 1 }">Next</button>'
+            if page_number < page_count else '<button type="button" aria-label="next" disabled>Next</button>'
+        )
+
+        content = f'''
+            <button type="button" data-automation-id="distanceLocation">Distance or Location</button>
+            <input type="radio" data-uxi-element-id="radio_distance">
+            <input data-automation-id="searchInput">
+            <button type="button" data-automation-id="viewAllJobsButton" data-action="go" data-href="/jobs?page=1">View Jobs</button>
+            <ul aria-label="Page { page_number } of { page_count }">{ items }</ul>
+            <nav aria-label="pagination">{ next_button }</nav>
+        '''
+        return page('Jobs', content, self.render_delay)
+
+    def job_page(self, query, job_id):
+        job = next((job for job in self.jobs if job['id'] == job_id), None)
+
+        if job is None or job_id in self.submitted:
+            return page('Job', '<h2 data-automation-id="alreadyApplied">You have already applied for this job.</h2>', self.render_delay)
+
+        if job['continue']:
+            button = f'<a data-automation-id="continueButton" href="/job/{ job_id }/apply/personal">Continue Application</a>'
+        else:
+            button = f'<a data-automation-id="adventureButton" href="/job/{ job_id }/apply/start">Apply</a>'
+
+        return page(job['title'], f'<h1>{ escape(job["title"]) }</h1>{ button }', self.render_delay)
+
+    def apply_page(self, query, job_id, step):
+        def next_url(step):
+            return f'/job/{ job_id }/apply/{ APPLY_STEPS[APPLY_STEPS.index(step) + 1] }'
+
+        if step == 'start':
+            content = f'<a data-automation-id="autofillWithResume" href="/job/{ job_id }/apply/upload">Autofill with Resume</a>'
+
+        elif step == 'upload':
+            content = f'''
+                <input type="file" data-automation-id="file-upload-input-ref" style="display: none;">
+                <div id="uploads"></div>
+                { self.navigation(next_url(step), back = False) }
+            '''
+
+        elif step == 'personal':
+            content = f'''
+                <button type="button" class="css-dsowhc">Back to Job Posting</button>
+                <input data-automation-id="sourceSearch">
+                <div data-automation-id="sourceMenu"></div>
+                <div id="referralBox"></div>
+                { fields_html(self.profile['personal_information']) }
+                { self.navigation(next_url(step)) }
+            '''
+
+        elif step == 'experience':
+            # The panels are created from the template by the "Add" button, like on the real portal.
+            panel = fields_html(self.profile['employment_history'][0]) if self.profile['employment_history'] else ''
+            panel += '<button type="button" data-automation-id="panel-set-delete-button" data-action="delete">Delete</button>'
+
+            content = f'''
+                <h2 class="css-1j9bnzb">My Experience</h2>
+                <div id="panels"><div data-automation-id="workExperience-1">{ panel }</div></div>
+                <template id="panelTemplate">{ panel }</template>
+                <button type="button" data-automation-id="Add Another" data-action="add">Add Another</button>
+                { self.navigation(next_url(step)) }
+            '''
+
+        elif step == 'questions_1':
+            inputs = ''.join(f'<label>{ escape(name) }<input></label>' for name in self.profile['application_questions_1'])
+            content = f'<h2>Application Questions</h2>{ inputs }{ self.navigation(next_url(step)) }'
+
+        elif step == 'questions_2':
+            # The portal has a focus stop before the grid, which the keyboard navigation tabs over.
+            checkboxes = ''.join(
+                f'<fieldset><legend>{ escape(week) }</legend>'
+                + ''.join(f'<label><input type="checkbox">{ escape(day) }</label>' for day in days)
+                + '</fieldset>'
+                for week, days in self.profile['application_questions_2'].items() if week != 'Overall'
+            )
+            content = f'<h2>Availability</h2><div tabindex="0">Weekly availability</div>{ checkboxes }<label>Overall<input></label>{ self.navigation(next_url(step)) }'
+
+        elif step == 'agreements':
+            content = f'<h2>Terms and Conditions</h2>{ fields_html(self.profile["agreements"]) }{ self.navigation(next_url(step)) }'
+
+        elif step == 'review':
+            content = f'<h2>Review</h2>{ self.navigation(next_url(step)) }'
+
+        else:
+            self.submitted.add(job_id)
+            content = '<h2>Application Submitted</h2>'
+
+        return page('Apply', content, self.render_delay)
+
+    #endregion
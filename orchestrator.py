@@ -0,0 +1,76 @@
+import json
+import asyncio
+import argparse
+from time import monotonic
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import main as company_runner
+import utils
+
+# Constants
+MAX_BROWSERS = 4  # Browsers open at the same time across all the companies.
+
+class Orchestrator:
+    # Runs several companies' flows at once: the blocking WebDriver calls of each run in a thread of a shared pool,
+    # scheduled by asyncio under a global limit of browsers. A company's flow is a single browser, so each one runs once.
+    def __init__(self, companies, max_browsers = MAX_BROWSERS):
+        self.companies = list(dict.fromkeys(companies))
+        self.max_browsers = max(1, max_browsers)
+
+    async def run_company(self, loop, executor, company, credentials, browsers):
+        async with browsers:
+            start = monotonic()
+            print(f'Starting { company }.')
+
+            try:
+                await loop.run_in_executor(executor, company_runner.apply, company, credentials)
+                status, error = 'done', None
+            except Exception as e: # Isolating the failure of a company from the others.
+                print(f'{ company } failed:\n', e)
+                status, error = 'failed', repr(e)
+
+            return { 'company': company, 'status': status, 'error': error, 'seconds': round(monotonic() - start, 3) }
+
+    async def run_async(self):
+        loop = asyncio.get_running_loop()
+        start = monotonic()
+
+        # Credentials are read once for all the companies; the profiles are shared through their `ProfileStore`.
+        credentials = utils.load_credentials()
+        browsers = asyncio.Semaphore(self.max_browsers)
+
+        with ThreadPoolExecutor(max_workers = self.max_browsers, thread_name_prefix = 'company') as executor:
+            results = await asyncio.gather(*(
+                self.run_company(loop, executor, company, credentials, browsers) for company in self.companies
+            ))
+
+        return self.summary(results, monotonic() - start)
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+    def summary(self, results, elapsed):
+        # One summary for the whole invocation; `slowest_seconds` is the lower bound of `elapsed_seconds`.
+        return {
+            'elapsed_seconds': round(elapsed, 3),
+            'slowest_seconds': max((result['seconds'] for result in results), default = 0),
+            'status': dict(Counter(result['status'] for result in results)),
+            'results': results,
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Runs the application flows of several companies concurrently.')
+    parser.add_argument('companies', nargs = '*', help = 'Companies to run (by their config names); every configured one by default.')
+    parser.add_argument('--max-browsers', type = int, default = MAX_BROWSERS)
+    parser.add_argument('--output', help = 'Where to save the summary as JSON.')
+    arguments = parser.parse_args()
+
+    summary = Orchestrator(arguments.companies or utils.list_companies(), arguments.max_browsers).run()
+    print(json.dumps(summary, indent = 4))
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(summary, file, indent = 4)
+
+if __name__ == '__main__':
+    main()
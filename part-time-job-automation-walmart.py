@@ -1,20 +1,55 @@
 import os
-import re
 import json
+import random
+import argparse
 import configparser
-from time import sleep
 from datetime import datetime
-from selenium import webdriver
+from time import monotonic, sleep
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.webelement import WebElement
+from waits import AdaptiveWait, SHORT_SETTLE_TIME
+from driver_factory import DriverOptions, create_driver
+from application_pool import ApplicationPool
+from session_cache import SessionCache
+from resume_index import ResumeIndex
+from candidate_profile import ProfileStore
+from form_filler import batch_fill
+from question_resolver import answer_questions
+from job_source import BrowserJobSource, WorkdayJobSource
+from ledger import ApplicationLedger
+from run_queue import RunQueue, DONE
+from tab_pool import TabPool
+from locators import Locators, LOCATORS_PATH
+from posting_tracker import PostingTracker, newest_first
+from job_filter import JobFilter
+from browser_recycler import BrowserRecycler
+from experience_sync import read_panels, differing_fields
+from tracing import tracer, traced, TracedWebDriverWait as WebDriverWait
 
 # Constants
 WAIT_TIME = 30  # Common wait time.
-SLEEP_TIME = 5  # Common sleep time.
-SHORT_SLEEP_TIME = 2  # Common short sleep time.
+SHORT_QUIET_WINDOW = 0.15  # Quiet window after a single key-press, as it only re-renders the focused control.
+
+# Possible states of a job posting (names of `locators.json`), raced against each other instead of waiting for each one to time out.
+JOB_PAGE_OUTCOMES = {
+    'apply': 'apply_button',
+    'continue': 'continue_button',
+    'submitted': 'already_applied_banner', # Only the banner, as the description of a posting may also mention having "already applied".
+    'error': 'error_page',
+    'unavailable': ('text', 'service unavailable'),
+}
+
+# Form pages of an application in their order; each of them ends with "Save and Continue".
+FORM_STEPS = ['personal_details', 'experiences', 'application_questions_1', 'application_questions_2', 'terms_and_conditions']
+
+# The resume upload page, or the personal details page when the portal skips the upload.
+UPLOAD_PAGE_OUTCOMES = {
+    'upload': 'upload_input', # A hidden file input, only taking `send_keys`, so it is raced by its presence.
+    'personal_details': 'back_to_posting',
+}
 
 class WalmartJobApplication:
     def __init__(self, config_file = 'config.ini'):
@@ -22,30 +57,141 @@ class WalmartJobApplication:
         self.config.read(config_file)
 
         self.driver_path = self.config['webdriver']['driver_path']
+
+        # Headless mode, blocked resources, cache directory and window size of the browser (`[browser]` section).
+        self.driver_options = DriverOptions.from_config(
+            self.config['browser'] if self.config.has_section('browser') else None,
+            driver_path = self.driver_path
+        )
         self.login_url = self.config['walmart']['login_url']
         self.jobs_url = self.config['walmart']['jobs_url']
         self.email = self.config['credentials']['email']
         self.password = self.config['credentials']['password']
 
-        self.location = 'CA/M2J 1S5/North York'  # Default location for job search
-        self.log_path = 'Resume/Resume Log.txt'
-        self.resume_folder = 'Resume'
+        # The candidate's search location and resumes; the batch runner gives every candidate its own.
+        self.location = self.config.get('candidate', 'location', fallback = 'CA/M2J 1S5/North York')  # Default location for job search
+        self.resume_folder = self.config.get('candidate', 'resume_folder', fallback = 'Resume')
+        self.log_path = self.config.get('candidate', 'log_path', fallback = os.path.join(self.resume_folder, 'Resume Log.txt'))
+
+        # Matching the job titles which none of the resume names match by the text of the PDFs (`scoring = true`).
+        # Imported only then, as it needs `numpy` and `pypdf`.
+        self.resume_scorer = None
+
+        if self.config.getboolean('resume', 'scoring', fallback = False):
+            from resume_scoring import ResumeScorer, MIN_SCORE
+
+            self.resume_scorer = ResumeScorer(
+                self.resume_folder,
+                self.config.get('resume', 'cache_dir', fallback = '.resume-cache'),
+                self.config.getfloat('resume', 'min_score', fallback = MIN_SCORE)
+            )
+
+        self.resume_index = ResumeIndex(self.resume_folder, self.resume_scorer)
+        self.logged_missing_titles = set()
 
         self.json_path = self.config['json']['json_path']
 
+        # Loading and validating the candidate's profile once (shared by all the workers), before any browser is started.
+        self.profiles = ProfileStore.shared(self.json_path)
+        self.profile = self.profiles.current()
+
+        # Filling the simple fields of a form in one injected script instead of several calls per field.
+        self.batch_fill = self.config.getboolean('form', 'batch_fill', fallback = True)
+
+        # Answering the questionnaires by their label text in the page instead of walking through them with the keyboard.
+        self.dom_questions = self.config.getboolean('form', 'dom_questions', fallback = True)
+
+        # Editing only the work-experience panels which differ from the profile instead of deleting and re-adding all of them.
+        self.experience_sync = self.config.getboolean('form', 'experience_sync', fallback = True)
+
+        # Readiness based waits, learning how long each step takes on this system/network (from all of the workers).
+        self.waits = AdaptiveWait.shared(self.config.get('waits', 'stats_path', fallback = 'wait_stats.json'))
+
+        # Fallback selectors of the page elements, and how often each of them matched.
+        self.locators = Locators(
+            self.waits,
+            self.config.get('locators', 'path', fallback = LOCATORS_PATH),
+            self.config.get('locators', 'stats_path', fallback = 'locator_stats.json')
+        )
+
+        # Number of parallel browser sessions and the minimum gap (seconds) between two job starts across them.
+        self.workers = self.config.getint('pool', 'workers', fallback = 1)
+        self.min_interval = self.config.getfloat('pool', 'min_interval', fallback = 0)
+        self.report_path = self.config.get('pool', 'report_path', fallback = 'Resume/Application Report.json')
+        self.config_file = config_file
+        self.max_pages = self.config.getint('pool', 'max_pages', fallback = 100)
+
+        # Number of the next job pages each session loads in background tabs while filling the current one.
+        self.prefetch = self.config.getint('pool', 'prefetch', fallback = 2)
+        self.tab_pool = None
+
+        # Restarting each browser after this many applications or above this much memory (MB); 0 turns a limit off.
+        self.recycler = BrowserRecycler(
+            self.config.getint('pool', 'recycle_after_jobs', fallback = 50),
+            self.config.getint('pool', 'recycle_above_mb', fallback = 1500)
+        )
+
+        # Title, location, store, time type and age rules dropping the jobs which would never be applied to, before opening them.
+        self.job_filter = JobFilter.from_config(self.config['filters'] if self.config.has_section('filters') else None)
+
+        # Where the job listings come from: `browser` (the filtered search page) or `workday` (the JSON search API).
+        self.source_type = self.config.get('source', 'type', fallback = 'browser')
+
+        # Outcome of every job applied so far, so that the repeated runs don't open the already submitted ones.
+        self.ledger = ApplicationLedger(self.config.get('ledger', 'path', fallback = 'Resume/Applications.sqlite3'))
+        self.current_step = None
+
+        # Checkpoints of the run (discovered jobs and the last saved page of each), kept next to the ledger.
+        self.run_queue = RunQueue(self.config.get('ledger', 'path', fallback = 'Resume/Applications.sqlite3'))
+        self.current_job = None
+
+        # Daemon mode: postings seen by the previous polls, and the seconds between two polls (randomly stretched by the jitter).
+        self.postings = PostingTracker(self.config.get('ledger', 'path', fallback = 'Resume/Applications.sqlite3'))
+        self.poll_interval = self.config.getfloat('daemon', 'interval', fallback = 300)
+        self.poll_jitter = self.config.getfloat('daemon', 'jitter', fallback = 0.2)
+
+        # Span tracing of the phases and the waits; costs nearly nothing while disabled.
+        tracer.configure(self.config.getboolean('tracing', 'enabled', fallback = False))
+        self.trace_jsonl_path = self.config.get('tracing', 'jsonl_path', fallback = 'Resume/Trace.jsonl')
+        self.trace_chrome_path = self.config.get('tracing', 'chrome_path', fallback = 'Resume/Trace.json')
+
+        # Cookies and local storage of the last good session, so that the next runs and workers can skip signing in.
+        self.session_cache = SessionCache(
+            self.config.get('session', 'cache_path', fallback = 'session_cache.json'),
+            self.locators,
+            self.config.getint('session', 'max_age', fallback = 8 * 60 * 60)
+        )
+
+    @traced('login')
     def login(self):
-        driver = webdriver.Edge(executable_path = self.driver_path)
+        driver = create_driver(self.driver_options)
+
+        # Storing the driver for executing a JavaScript on the page.
+        self.executable_driver = driver
+
+        # Re-using the cached session and signing in only when the portal rejects it.
+        if self.session_cache.restore(driver, self.login_url):
+            print('Restored the cached session.')
+            return driver
+
+        self.sign_in(driver)
+
+        # Caching the fresh session for the next runs and the other workers.
+        self.session_cache.save(driver)
+
+        return driver
 
+    @traced('sign_in')
+    def sign_in(self, driver):
         driver.get(self.login_url)
 
         # Wait for email input field to be visible
-        WebDriverWait(driver, WAIT_TIME).until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'input[data-automation-id="email"]')))
+        email_field = self.locators.find(driver, 'email_input', WAIT_TIME)
 
         # Login
-        email_field = driver.find_element(By.CSS_SELECTOR, 'input[data-automation-id="email"]')
         email_field.send_keys(self.email)
 
-        password_field = driver.find_element(By.CSS_SELECTOR, 'input[data-automation-id="password"]')
+        password_field = self.locators.find(driver, 'password_input', WAIT_TIME, present = True)
         password_field.send_keys(self.password)
 
         # Pressing the Sign-In button manually because can't find it's source using HTML code.
@@ -54,14 +200,12 @@ class WalmartJobApplication:
         # Waiting a little to let the system know that it is a user-input and not a machine doing DOS attack.
         # sleep(SLEEP_TIME)
 
-        sign_in_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'div[data-automation-id="click_filter"]'))
-        )
+        sign_in_button = self.locators.find(driver, 'sign_in_button', WAIT_TIME)
 
         # Clicking the button thrice as on pressing it once sometimes doesn't work.
         sign_in_button.click()
         sign_in_button.send_keys(Keys.SPACE)
-        sleep(SHORT_SLEEP_TIME) # Waiting for a natural delay.
+        self.waits.settle(driver, 'login_sign_in', timeout = SHORT_SETTLE_TIME) # Waiting for the page to react on the first click.
         try: # Preventing to crash when the login is already done.
             sign_in_button.send_keys(Keys.SPACE) # This was only in the case when the system would not login on the first try.
         except StaleElementReferenceException as sere:
@@ -70,141 +214,176 @@ class WalmartJobApplication:
         # Wait for login to complete
         WebDriverWait(driver, WAIT_TIME).until(EC.url_contains('userHome')) # Scrum NOTE: Remove in future or place it outside this function and find better way to determine whether the user has been successfully logged in.
 
-        sleep(SLEEP_TIME) # Waiting a little for letting the system login
-
-        # Storing the driver for executing a JavaScript on the page.
-        self.executable_driver = driver
+        self.waits.settle(driver, 'login') # Waiting for the user home to finish loading.
 
         return driver
 
+    @traced('search_jobs')
     def search_jobs(self, driver):
         driver.get(self.jobs_url)
 
         # Step 1: Click on the Filter button
-        filter_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="distanceLocation"]'))
-        )
+        filter_button = self.locators.find(driver, 'distance_filter', WAIT_TIME)
         driver.execute_script("arguments[0].click();", filter_button)
 
         # Step 2: Select the Distance radio button directly
-        distance_radio_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[data-uxi-element-id="radio_distance"]'))
-        )
+        distance_radio_button = self.locators.find(driver, 'distance_radio', WAIT_TIME, present = True)
         driver.execute_script("arguments[0].click();", distance_radio_button)
 
         # Step 3: Enter full string in the search input
-        postal_code_field = WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[data-automation-id="searchInput"]'))
-        )
-        postal_code_field.send_keys('CA/M2J 1S5/North York')  # Enter the full string
+        postal_code_field = self.locators.find(driver, 'search_input', WAIT_TIME, present = True)
+        postal_code_field.send_keys(self.location)  # Enter the full string
 
-        # Step 4: Wait for a few seconds to allow suggestions to load
-        sleep(SLEEP_TIME)
+        # Step 4: Wait for the suggestions request to complete and render
+        self.waits.settle(driver, 'search_suggestions')
 
         # Step 5: Press Down arrow key and Enter to select the suggestion
         postal_code_field.send_keys(Keys.DOWN)
         postal_code_field.send_keys(Keys.ENTER)
 
         # Step 6: Click on the View Jobs button
-        view_jobs_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="viewAllJobsButton"]'))
-        )
+        view_jobs_button = self.locators.find(driver, 'view_jobs_button', WAIT_TIME)
         driver.execute_script("arguments[0].click();", view_jobs_button)
 
         print("Filtered jobs by location")
 
-        # Waiting for a few seconds to allow the searched data to load.
-        sleep(SLEEP_TIME)
+        # Waiting for the searched data to load.
+        self.waits.settle(driver, 'search_results')
 
         return driver
 
-    def open_job_in_new_tab(self, driver, job_title, job_link):
-        # Open job link in a new tab
-        current_window = driver.current_window_handle
-        driver.execute_script("window.open();")
+    def tabs(self, driver):
+        # Tabs of the session, created once per browser (a restarted worker gets a new one).
+        if self.tab_pool is None or self.tab_pool.driver is not driver:
+            self.tab_pool = TabPool(driver, self.prefetch + 1)
 
-        sleep(SLEEP_TIME)  # Wait to allow the new tab to open.
+        return self.tab_pool
 
-        new_window = [window for window in driver.window_handles if window != current_window][0]
+    @traced('job')
+    def open_job_in_new_tab(self, driver, job_title, job_link, upcoming_links = ()):
+        # Picking up the latest profile snapshot in case the file was edited since the last application.
+        self.profile = self.profiles.current()
 
-        driver.switch_to.window(new_window)
-        driver.get(job_link)
+        # Switching to the job's tab, preloaded while the previous job was being filled, and starting to load the next ones.
+        tabs = self.tabs(driver)
+        job_window = tabs.open(job_link, upcoming_links)
+
+        try:
+            # Match job title with available resumes
+            matching_resume = self.find_resume(job_title)
 
-        # Match job title with available resumes
-        matching_resume = self.find_resume(job_title)
+            if not matching_resume:
+                return 'skipped_no_resume'
 
-        if matching_resume:
             # Proceed with application process using matching_resume
             print(f"Applying to { job_title } using { matching_resume }")
 
             # Implement application process (form filling, submission, etc.)
             try:
-                self.apply_job(driver)
+                return self.apply_job(driver)
             except TimeoutException as te: # This means the application might be already filled in past.
                 # Ignore such applications.
-                return
+                return 'partial'
+
+        finally:
+            # Recycling the tab in every case so that the next job starts from the listing window.
+            tabs.release(job_window)
+
+    def apply_to(self, driver, job, upcoming = ()):
+        # Applying to a discovered job and recording its outcome (and the step it stopped at) in the ledger.
+        self.current_step = None
+        self.current_job = job
+        self.run_queue.start(job)
 
-        driver.close()
-        driver.switch_to.window(current_window)
+        try:
+            status = self.open_job_in_new_tab(driver, job.title, job.link, [job.link for job in upcoming])
+        except Exception as e:
+            self.ledger.record(job, 'failed', self.current_step, repr(e))
+            self.run_queue.fail(job)
+            raise
+        finally:
+            self.current_job = None
+
+        self.ledger.record(job, status, self.current_step)
+        self.run_queue.set_state(job, DONE)
+        return status
+
+    def enter_step(self, step):
+        # Checkpointing the form page just saved, so that a retried application can skip it.
+        if self.current_job and self.current_step in FORM_STEPS:
+            self.run_queue.complete_step(self.current_job, self.current_step)
+
+        self.current_step = step
+
+    def saved_steps(self):
+        # Form pages saved on the portal in a previous attempt of the current job.
+        last_step = self.run_queue.last_step(self.current_job) if self.current_job else None
+        return FORM_STEPS[ : FORM_STEPS.index(last_step) + 1] if last_step in FORM_STEPS else list()
 
     def find_resume(self, job_title):
-        # Normalize job title for comparison
-        normalized_job_title = re.sub(r'\(.*?\)\s*', '', job_title, flags = re.IGNORECASE).strip().lower()
-
-        # Find matching resume
-        resume_found = False
-        self.resume_file = str()
-
-        # List all resumes in the Resume folder
-        for resume_file in os.listdir(self.resume_folder):
-            if resume_file.endswith('.pdf'):
-                normalized_resume_name = re.sub(r'\.pdf$', '', resume_file, flags = re.IGNORECASE).strip().lower()
-                if normalized_job_title == normalized_resume_name:
-                    resume_found = True
-                    self.resume_file = resume_file
-                    break
+        # Looking up the indexed resumes (exact, then word-set, then typo-tolerant match).
+        self.resume_file = self.resume_index.find(job_title) or str()
 
         # Steps on finding the resume
-        if resume_found:
-            return resume_found
+        if self.resume_file:
+            return self.resume_file
         else:
-            # Log missing resume
-            log_message = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Resume not found for job title: { job_title }\n"
-            with open(self.log_path, 'a') as log_file:
-                log_file.write(log_message)
-
+            self.log_missing_resume(job_title)
             return None
 
+    def find_resumes(self, job_titles):
+        # Resolving a whole listing page at once, logging the titles without any resume.
+        resumes = self.resume_index.find_all(job_titles)
+
+        for job_title, resume_file in resumes.items():
+            if not resume_file:
+                self.log_missing_resume(job_title)
+
+        return resumes
+
+    def log_missing_resume(self, job_title):
+        # Logging each missing title once per run, no matter how many times it's posted.
+        if job_title in self.logged_missing_titles:
+            return
+
+        self.logged_missing_titles.add(job_title)
+
+        log_message = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Resume not found for job title: { job_title }\n"
+        with open(self.log_path, 'a') as log_file:
+            log_file.write(log_message)
+
+    @traced('apply_job')
     def apply_job(self, driver):
 
-        is_resume_needed = True
+        self.current_step = 'start'
 
-        #region Fresh Application
+        #region Fresh or Continuing Old Application
 
         try:
-            # Click the "Apply" button
-            WebDriverWait(driver, WAIT_TIME).until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[data-automation-id="adventureButton"]'))).click()
-        except TimeoutException as te: # This means the application might be already filled partially in the past.
-            # Ignore such applications.
-            is_resume_needed = False
-            print(f'Uploading Resume: { is_resume_needed }.\n', te)
+            # Whichever the posting shows first: "Apply", "Continue Application", the already-applied banner or an error.
+            outcome, button = self.locators.race(driver, 'job_page', JOB_PAGE_OUTCOMES, WAIT_TIME, present = ('submitted',))
+        except TimeoutException as te: # None of the known states; the posting might have been taken down.
+            print('Can\'t find the Apply or the Continue Application button.\nSomething went wrong!\n', te)
+            return 'not_available'
 
-        #endregion
+        if outcome == 'submitted':
+            print('Already applied to this job.')
+            return 'already_submitted'
 
-        #region Continuing Old Application
+        if outcome in ('error', 'unavailable'):
+            print('The job posting failed to load.')
+            return 'page_error'
 
-        try:
-            if not is_resume_needed:
-                # Click the "Continue Application" button
-                WebDriverWait(driver, WAIT_TIME).until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[data-automation-id="continueButton"]'))).click()
-        except TimeoutException as te: # This means the application might be already filled in the past.
-            # Re-Fill The Whole Form.
-            print('Can\'t find the Continue Application button either.\nSomething went wrong!\n', te)
-            return
+        # Click the "Apply" button, or the "Continue Application" button for the applications filled partially in the past.
+        button.click()
+        is_resume_needed = outcome == 'apply'
+        print(f'Uploading Resume: { is_resume_needed }.')
+
+        #endregion
 
         if is_resume_needed:
             # Click the "Autofill with Resume" button
-            WebDriverWait(driver, WAIT_TIME).until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[data-automation-id="autofillWithResume"]'))).click()
+            self.locators.find(driver, 'autofill_with_resume', WAIT_TIME).click()
 
         # Validator: When the appropriate resume is available, fill the form.
         if self.resume_file:
@@ -212,53 +391,75 @@ class WalmartJobApplication:
             # Saving a timeout exception for not uploading the resume when continuing the application.
             if is_resume_needed:
                 print('Uploading the Resume.')
+                self.enter_step('uploading_resume')
                 self.uploading_resume(driver)
 
-            print('Filling Personal Details.')
-            self.choose_personal_details(driver)
-
-            print('Filling Experiences.')
-            self.fill_experiences_and_languages(driver)
-
-            print('Filling Application Questions 1.')
-            self.fill_application_questions_1(driver)
-            print('Filling Application Questions 2.')
-            self.fill_application_questions_2(driver)
-
-            print('Accepting Terms and Conditions.')
-            self.terms_and_conditions_acceptance(driver)
+            # The portal keeps the saved pages of a continued application, so the ones saved before a crash are only clicked through.
+            saved_steps = self.saved_steps() if not is_resume_needed else list()
+
+            for step, message, fill_page in (
+                ('personal_details', 'Filling Personal Details.', self.choose_personal_details),
+                ('experiences', 'Filling Experiences.', self.fill_experiences_and_languages),
+                ('application_questions_1', 'Filling Application Questions 1.', self.fill_application_questions_1),
+                ('application_questions_2', 'Filling Application Questions 2.', self.fill_application_questions_2),
+                ('terms_and_conditions', 'Accepting Terms and Conditions.', self.terms_and_conditions_acceptance),
+            ):
+                self.enter_step(step)
+
+                if step in saved_steps:
+                    print(f'Skipping the already saved page: { step }.')
+                    self.waits.settle(driver, 'saved_page')
+                    self.save_and_continue(driver)
+                else:
+                    print(message)
+                    fill_page(driver)
 
             # Final Review Page takes time to get loaded.
-            sleep(SLEEP_TIME)
+            self.waits.settle(driver, 'review_page')
 
             # Submitting the information and going to the next page.
             print('Reviewing and Submitting.')
+            self.enter_step('review_and_submit')
             self.save_and_continue(driver)
 
             # Waiting for the UI to submit the form.
-            sleep(SLEEP_TIME)
+            self.waits.settle(driver, 'submit')
+
+            return 'submitted'
         else:
             log_message = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Resume file not found before uploading!\n"
             with open(self.log_path, 'a') as log_file:
                 log_file.write(log_message)
 
+            return 'skipped_no_resume'
+
+    @traced('uploading_resume')
     def uploading_resume(self, driver):
+        try:
+            outcome, upload_element = self.locators.race(driver, 'upload_page', UPLOAD_PAGE_OUTCOMES, WAIT_TIME, present = ('upload',))
+        except TimeoutException:
+            outcome = None
+
+        if outcome != 'upload':
+            # Skipping the step to upload the resume.
+            return
+
         try:
             # Upload the resume file
-            upload_element = WebDriverWait(driver, WAIT_TIME).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[data-automation-id="file-upload-input-ref"]')))
             upload_element.send_keys(os.path.join(os.getcwd(), self.resume_folder, self.resume_file))
 
             # Wait until the resume is uploaded
-            WebDriverWait(driver, WAIT_TIME).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-automation-id="file-upload-item"]')))
+            self.locators.find(driver, 'uploaded_file', WAIT_TIME, present = True)
 
             # Click the "Continue" button
-            continue_button = WebDriverWait(driver, WAIT_TIME).until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="bottom-navigation-next-button"]')))
+            continue_button = self.locators.find(driver, 'next_button', WAIT_TIME)
             continue_button.click()
 
         except TimeoutException:
             # Skipping the step to upload the resume.
             pass
 
+    @traced('personal_details')
     def choose_personal_details(self, driver):
         #region Referral Option Selection
 
@@ -269,18 +470,11 @@ class WalmartJobApplication:
             EC.url_contains('job')
         )
 
-        try:
-            # Waiting for the back button to render.
-            WebDriverWait(driver, WAIT_TIME).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="bottom-navigation-back-button"]'))
-            )
-        except TimeoutException:
-            pass # Possible that sometimes we don't have `Back` button on this page so we pass this step.
+        # Waiting for the page to render: either the back button or the `Back to Job Posting` option, as sometimes we don't have the `Back` button.
+        self.locators.race(driver, 'personal_details_page', { 'back': 'back_button', 'posting': 'back_to_posting' }, WAIT_TIME)
 
         # Focusing on the `Back to Job Posting` option for reliable focus tabbing.
-        back_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[class="css-dsowhc"]'))
-        )
+        back_button = self.locators.find(driver, 'back_to_posting', WAIT_TIME)
 
         # Tabbing to gain focus of the search bar.
         back_button.send_keys(Keys.TAB)
@@ -301,20 +495,16 @@ class WalmartJobApplication:
         #endregion
 
         # Select the Referral option
-        referral_option = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'div[data-automation-label="Referral"]'))
-        )
+        referral_option = self.locators.find(driver, 'referral_option', WAIT_TIME)
         referral_option.click()
 
         # Select the first radio button ("I know someone who works here")
-        first_radio_button = WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'div[data-automation-id="promptOption"]'))
-        )
+        first_radio_button = self.locators.find(driver, 'prompt_option', WAIT_TIME)
         first_radio_button.click()
 
         # Wait for the dialog to disappear after selection (if applicable)
         WebDriverWait(driver, WAIT_TIME).until_not(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-automation-label="Referral"]'))
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.locators.css('referral_option')))
         )
 
         #endregion
@@ -325,19 +515,15 @@ class WalmartJobApplication:
         referral_value = self.config.get('walmart', 'referral_email')
 
         # Wait for the text box to appear
-        referral_text_box = WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[data-automation-id="referral"]'))
-        )
+        referral_text_box = self.locators.find(driver, 'referral_input', WAIT_TIME, present = True)
 
         referral_text_box.clear()
 
         del referral_text_box
 
-        sleep(SHORT_SLEEP_TIME) # Waiting for the instance to be deleted.
+        self.waits.settle(driver, 'referral_clear', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME) # Waiting for the text box to be re-rendered.
 
-        referral_text_box = WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[data-automation-id="referral"]'))
-        )
+        referral_text_box = self.locators.find(driver, 'referral_input', WAIT_TIME, present = True)
 
         # Input the referral value into the text box
         referral_text_box.send_keys(referral_value)
@@ -346,60 +532,88 @@ class WalmartJobApplication:
 
         #region Other Personal Details from Resume
 
-        json_data = self.load_json(self.json_path)
-        self.fill_form(driver, json_data['personal_information'])
+        self.fill_form(driver, self.profile.personal_information)
 
         #endregion
 
         # Going to the next page to fill other details of the form.
         self.save_and_continue(driver)
 
+    @traced('fill_experiences')
     def fill_experiences(self, driver):
         
         # Waiting for the page to load the content.
-        WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'h2[class="css-1j9bnzb"]'))
-        )
+        self.locators.find(driver, 'experiences_header', WAIT_TIME, present = True)
 
         # Waiting for the page-content to be loaded as the changes will take a while to be loaded.
         # This depends on the internet speed on the system/network running.
-        sleep(SLEEP_TIME)
+        self.waits.settle(driver, 'experiences_page')
 
-        json_data = self.load_json(self.json_path)
+        if self.experience_sync:
+            try:
+                return self.sync_experiences(driver)
+            except WebDriverException as wde: # Starting over from the clean panels.
+                print('WebDriverException - Experience Sync:\n', wde)
+
+        self.rebuild_experiences(driver)
+
+    def sync_experiences(self, driver):
+        # Reading all of the panels at once and touching only the ones (and the fields) which differ from the profile.
+        experiences = self.profile.employment_history
+        panels = read_panels(driver, self.locators.css('experience_panel'))
+
+        # Deleting the extra panels from the last one, so that the indexes of the kept ones don't change.
+        for panel in reversed(panels[len(experiences) : ]):
+            panel['element'].find_element(By.CSS_SELECTOR, self.locators.css('delete_panel')).click()
+
+        for _ in range(len(experiences) - len(panels)):
+            self.locators.find(driver, 'add_panel', WAIT_TIME, present = True).click()
+
+        if len(panels) != len(experiences):
+            self.waits.settle(driver, 'experiences_sync', timeout = SHORT_SETTLE_TIME) # Waiting for the panels to be added/removed.
+            panels = read_panels(driver, self.locators.css('experience_panel'))
 
+        synced_panels = 0
+
+        for panel, experience in zip(panels, experiences):
+            fields = differing_fields(experience, panel['values'])
+
+            if fields:
+                self.fill_form(panel['element'], fields)
+                synced_panels += 1
+
+        print(f'Work experiences: { synced_panels } of { len(experiences) } panels edited.')
+
+    def rebuild_experiences(self, driver):
         # Fetching all of the previous experiences' objects already available in the form.
-        experience_elements = driver.find_elements(By.XPATH, "//div[starts-with(@data-automation-id, 'workExperience-')]")
+        experience_elements = driver.find_elements(By.CSS_SELECTOR, self.locators.css('experience_panel'))
 
         # Remove all and then add one-by-one.
         for _ in experience_elements:
 
             # Clicking the delete button for each of the job experiences already present on the web-page.
-            WebDriverWait(driver, WAIT_TIME).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="panel-set-delete-button"]'))
-            ).click()
+            self.locators.find(driver, 'delete_panel', WAIT_TIME).click()
 
-        sleep(SHORT_SLEEP_TIME) # Waiting for the page to get loaded with the fresh UI.
+        self.waits.settle(driver, 'experiences_delete', timeout = SHORT_SETTLE_TIME) # Waiting for the page to get loaded with the fresh UI.
 
         # Adding number of experiences forms as the number of for experiences.
-        for _ in json_data['employment_history']:
+        for _ in self.profile.employment_history:
 
-            WebDriverWait(driver, WAIT_TIME).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[data-automation-id="Add"], button[data-automation-id="Add Another"]'))
-            ).click()
+            self.locators.find(driver, 'add_panel', WAIT_TIME, present = True).click()
 
-        sleep(SHORT_SLEEP_TIME) # Waiting for a short break for letting the UI be loaded.
+        self.waits.settle(driver, 'experiences_add', timeout = SHORT_SETTLE_TIME) # Waiting for the new panels to be rendered.
 
         # Again, getting the objects to manipuate the data to the latest sources/ids.
-        experience_elements = driver.find_elements(By.XPATH, "//div[starts-with(@data-automation-id, 'workExperience-')]")
+        experience_elements = driver.find_elements(By.CSS_SELECTOR, self.locators.css('experience_panel'))
 
         # Iterate over each experience to fill it in the form.
-        for experience_index in range(len(json_data['employment_history'])):
+        for experience_index in range(len(self.profile.employment_history)):
             try:
-                self.fill_form(experience_elements[experience_index], json_data['employment_history'][experience_index])
+                self.fill_form(experience_elements[experience_index], self.profile.employment_history[experience_index])
             except IndexError as ie:
                 print(ie)
-                experience_elements = driver.find_elements(By.XPATH, "//div[starts-with(@data-automation-id, 'workExperience-')]")
-                self.fill_form(experience_elements[experience_index], json_data['employment_history'][experience_index])
+                experience_elements = driver.find_elements(By.CSS_SELECTOR, self.locators.css('experience_panel'))
+                self.fill_form(experience_elements[experience_index], self.profile.employment_history[experience_index])
 
     def execute_java_script(self, java_script):
         self.executable_driver.execute_script(java_script)
@@ -421,40 +635,87 @@ class WalmartJobApplication:
 
         # Going to the first question.
         active_element.send_keys(Keys.TAB)
-        sleep(SHORT_SLEEP_TIME) # Delay for smooth working.
+        self.waits.settle(driver, 'tab', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME) # Waiting for the focus to move.
 
         # Selecting the active element which is currently on focus.
         active_element = driver.switch_to.active_element
 
         # Answering first question.
         active_element.send_keys(key)
-        sleep(SHORT_SLEEP_TIME)  # 2-second delay
+        self.waits.settle(driver, 'type', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME) # Waiting for the answer to be rendered.
 
         # Selecting the active element which is currently on focus.
         active_element = driver.switch_to.active_element
 
         return active_element
 
+    @traced('application_questions_1')
     def fill_application_questions_1(self, driver):
 
         # Waiting for the page to be loaded and rendered.
-        sleep(SLEEP_TIME)
+        self.waits.settle(driver, 'application_questions_1')
 
-        json_data = self.load_json(self.json_path)
+        # A question is matched by its text in the profile ("question"), or by its key when there is none.
+        answers = [
+            (question_instance.get('question', question_name), question_instance['context'])
+            for question_name, question_instance in self.profile.application_questions_1.items()
+        ]
 
-        # Getting focused element to answer the questions based on key-press events.
-        active_element = driver.switch_to.active_element
+        if not self.answer_questions(driver, answers):
+            # Getting focused element to answer the questions based on key-press events.
+            active_element = driver.switch_to.active_element
 
-        for question_instance in json_data['application_questions_1'].values():
-            active_element = self.tab_and_type(driver, active_element, question_instance['context'])
+            for question_instance in self.profile.application_questions_1.values():
+                active_element = self.tab_and_type(driver, active_element, question_instance['context'])
 
         # Submitting the information and going to the next page.
         self.save_and_continue(driver)
 
+    def answer_questions(self, driver, answers):
+        # Answering every question of the page in two round-trips; `False` tells to fall back to the keyboard navigation.
+        if not self.dom_questions:
+            return False
+
+        try:
+            with tracer.span('answer_questions', questions = len(answers)):
+                report = answer_questions(driver, answers)
+        except WebDriverException as wde:
+            print('WebDriverException - Answering Questions:\n', wde)
+            return False
+
+        if not report:
+            return False
+
+        # The questions which the profile has no answer for are left as the keyboard navigation would leave them.
+        uncovered = [question for question, status in report.items() if status == 'unanswered']
+        if uncovered:
+            print('Questions not in the profile:', uncovered)
+
+        # Any answer of the profile which wasn't set (or nothing set at all) is left to the keyboard navigation.
+        unanswered = { question: status for question, status in report.items() if status not in ('filled', 'typed', 'unanswered') }
+        if unanswered or len(uncovered) == len(report):
+            print('Questions not answered:', unanswered)
+            return False
+
+        # Letting the page react to the answers (e.g. showing the follow-up questions) before saving.
+        self.waits.settle(driver, 'answers', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME)
+        return True
+
+    @traced('application_questions_2')
     def fill_application_questions_2(self, driver):
 
         # Waiting for the page to be loaded and rendered.
-        sleep(SLEEP_TIME)
+        self.waits.settle(driver, 'application_questions_2')
+
+        # Weeks of the availability grid are answered with their days, "Overall" with its context.
+        answers = [
+            (week_key, question_instance['context'] if week_key == 'Overall' else question_instance)
+            for week_key, question_instance in self.profile.application_questions_2.items()
+        ]
+
+        if self.answer_questions(driver, answers):
+            self.save_and_continue(driver)
+            return
 
         # Locate the checkboxes
         # checkboxes = driver.find_elements_by_css_selector("input[type='checkbox']")
@@ -468,16 +729,13 @@ class WalmartJobApplication:
         #         checkbox.send_keys(Keys.SPACE)
         #         sleep(SHORT_SLEEP_TIME)  # A few seconds delay
 
-        json_data = self.load_json(self.json_path)
-
         # Getting focused element to answer the questions based on key-press events.
         active_element = driver.switch_to.active_element
-        sleep(SHORT_SLEEP_TIME)
         active_element.send_keys(Keys.TAB) # Going to the ghost element to focus on the first check-box using the function.
-        sleep(SHORT_SLEEP_TIME)
+        self.waits.settle(driver, 'tab', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME)
         active_element = driver.switch_to.active_element
 
-        for week_key, question_instance in json_data['application_questions_2'].items():
+        for week_key, question_instance in self.profile.application_questions_2.items():
 
             # Switching between dropdown and checkboxes.
             if week_key != "Overall":
@@ -487,7 +745,7 @@ class WalmartJobApplication:
 
                 # Tabbing to move to the next day.
                 active_element.send_keys(Keys.TAB)
-                sleep(SHORT_SLEEP_TIME)
+                self.waits.settle(driver, 'tab', SHORT_QUIET_WINDOW, SHORT_SETTLE_TIME)
 
             else:
                 # Tabbing back because there will be an extra tabs for this input.
@@ -500,148 +758,208 @@ class WalmartJobApplication:
         # Submitting the information and going to the next page.
         self.save_and_continue(driver)
 
+    @traced('terms_and_conditions')
     def terms_and_conditions_acceptance(self, driver):
 
-        # Loading the agreement data from the JSON file.
-        json_data = self.load_json(self.json_path)
-        
         # Filling the agreements as requested in the form.
-        self.fill_form(driver, json_data['agreements'])
+        self.fill_form(driver, self.profile.agreements)
 
         # Waiting for the UI to get updated.
-        sleep(SHORT_SLEEP_TIME)
+        self.waits.settle(driver, 'agreements', timeout = SHORT_SETTLE_TIME)
 
         # Submitting the information and going to the next page.
         self.save_and_continue(driver)
 
     #region Automative Form Filling
 
-    def load_json(self, file_path):
-        with open(file_path, 'r') as file:
-            return json.load(file)
-
+    @traced('save_and_continue')
     def save_and_continue(self, driver):
-        WebDriverWait(driver, WAIT_TIME).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-automation-id="bottom-navigation-next-button"]'))
-        ).click()
+        self.locators.find(driver, 'next_button', WAIT_TIME).click()
 
+    @traced('fill_form')
     def fill_form(self, driver, fields):
+        if not self.batch_fill:
+            return self.fill_form_by_elements(driver, fields)
+
+        # Filling everything possible in a single round-trip.
+        with tracer.span('fill_form.batch', fields = len(fields)):
+            report = batch_fill(driver, fields)
+
+        # Falling back to the element-by-element filling (in the original order) for the rest.
+        remaining_fields = { field_name: field for field_name, field in fields.items() if report.get(field_name) != 'filled' }
+
+        if remaining_fields:
+            print('Filling by elements:', { field_name: report.get(field_name) for field_name in remaining_fields })
+            self.fill_form_by_elements(driver, remaining_fields)
+
+    def fill_form_by_elements(self, driver, fields):
         wait = WebDriverWait(driver, WAIT_TIME)
 
         #region Clears the text in one-go.
 
-        for field in fields.values():
+        text_fields = [field for field in fields.values() if field['type'] in ('text', 'paragraph')]
 
-            if field['type'] == 'text' or \
-                field['type'] == 'paragraph':
-                try:
-                    element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-automation-id="{ field["location"] }"]')))
-                    element.clear()
-                    del element
-                except TimeoutException as te: # When the text-box is not found or will take time to render.
-                    print('TimeoutException:\n', te) # Ignore it and move further.
+        if text_fields:
+            try:
+                # Waiting once for the form to render instead of a whole timeout per missing text-box.
+                # The race runs on the whole page, also when the form is a part of it (e.g. a work-experience panel).
+                self.waits.race(driver.parent if isinstance(driver, WebElement) else driver, 'form_render', {
+                    field_name: ('css', f'[data-automation-id="{ field["location"] }"]') for field_name, field in fields.items()
+                }, WAIT_TIME)
+            except TimeoutException as te: # When none of the text-boxes is found.
+                print('TimeoutException:\n', te) # Ignore it and move further.
+
+        for field in text_fields:
+            for element in driver.find_elements(By.CSS_SELECTOR, f'[data-automation-id="{ field["location"] }"]')[ : 1]:
+                element.clear()
 
         #endregion
 
         #region Fills the data in the empty containers.
 
         for field_name, field in fields.items():
-            element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-automation-id="{ field["location"] }"]')))
+            with tracer.span('fill_field', field = field_name, type = field['type']):
+                is_done = self.fill_field(driver, wait, field_name, field)
 
-            if field['type'] == 'text':
-                try:
-                    element.send_keys(field['value'])
+            if is_done:
+                return
 
-                    try:
-                        # Set the value of the text box using JavaScript
-                        driver.execute_script(f"arguments[0].value = '{ field['value'] }';", element)
-                    except AttributeError as ae:
-                        # When the `driver` doesn't support `execute_script()` functionality.
-                        print('AttributeError - Text:\n', ae)
+        #endregion
 
-                except StaleElementReferenceException as sere:
-                    print('StaleElementReferenceException - Text:\n', sere)
+    def fill_field(self, driver, wait, field_name, field):
+        element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-automation-id="{ field["location"] }"]')))
+
+        if field['type'] == 'text':
+            try:
+                element.send_keys(field['value'])
 
-            elif field['type'] == 'paragraph': # This type is used to write a whole paragraph and also includes the code-snippets.
                 try:
-                    # Iterating over each element of the list to be written.
-                    for item in field['items']:
-                        element.send_keys(item)
-                        element.send_keys(Keys.ENTER)
-
-                except StaleElementReferenceException as sere:
-                    print('StaleElementReferenceException - Paragraph:\n', sere)
-
-            elif field['type'] == 'dropdown': # NOTE: Using different/specialized/customized logic for dropdowns at moment only but will optimize in the future.
-                # Wait for the dropdown button to be present and click it to open the dropdown menu
-                wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'button[data-automation-id="{ field["location"] }"]'))).click()
-
-                # Wait for the dropdown options to be visible and locate the option for State.
-                wait.until(EC.element_to_be_clickable((By.XPATH, f'//li[@data-value="{ field["key"] }"]/div[contains(text(), "{ field["value"] }")]'))).click()
-
-                #region Code for the normal dropdowns
-                # element.click()
-                # option = WebDriverWait(driver, WAIT_TIME).until(
-                #     EC.presence_of_element_located((By.XPATH, f"//option[text()='{ field['value'] }']"))
-                # )
-                # option.click()
-                #endregion
+                    # Set the value of the text box using JavaScript
+                    driver.execute_script("arguments[0].value = arguments[1];", element, field['value'])
+                except AttributeError as ae:
+                    # When the `driver` doesn't support `execute_script()` functionality.
+                    print('AttributeError - Text:\n', ae)
 
-            elif field['type'] == 'radio':
+            except StaleElementReferenceException as sere:
+                print('StaleElementReferenceException - Text:\n', sere)
+
+        elif field['type'] == 'paragraph': # This type is used to write a whole paragraph and also includes the code-snippets.
+            try:
+                # Iterating over each element of the list to be written.
+                for item in field['items']:
+                    element.send_keys(item)
+                    element.send_keys(Keys.ENTER)
+
+            except StaleElementReferenceException as sere:
+                print('StaleElementReferenceException - Paragraph:\n', sere)
+
+        elif field['type'] == 'dropdown': # NOTE: Using different/specialized/customized logic for dropdowns at moment only but will optimize in the future.
+            # Wait for the dropdown button to be usable and click it to open the dropdown menu
+            self.waits.element(driver, 'dropdown_button', (By.CSS_SELECTOR, f'button[data-automation-id="{ field["location"] }"]'), WAIT_TIME).click()
+
+            # Wait for the dropdown options to stop sliding in and locate the option for State.
+            self.waits.element(driver, 'dropdown_option', (By.XPATH, f'//li[@data-value="{ field["key"] }"]/div[contains(text(), "{ field["value"] }")]'), WAIT_TIME).click()
+
+            #region Code for the normal dropdowns
+            # element.click()
+            # option = WebDriverWait(driver, WAIT_TIME).until(
+            #     EC.presence_of_element_located((By.XPATH, f"//option[text()='{ field['value'] }']"))
+            # )
+            # option.click()
+            #endregion
+
+        elif field['type'] == 'radio':
+            element.click()
+
+        elif field['type'] == 'checkbox':
+            if not element.is_selected():
                 element.click()
 
-            elif field['type'] == 'checkbox':
-                if not element.is_selected():
-                    element.click()
+        elif field['type'] == 'date':
+            element = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, f'input[data-automation-id="{ field["location"] }"]'))) # Expecting two objects at least from this script.
+
+            if field_name[ : 5] == 'start':
+
+                #region Start-Date
+
+                element = element[0]
 
-            elif field['type'] == 'date':
-                element = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, f'input[data-automation-id="{ field["location"] }"]'))) # Expecting two objects at least from this script.
+                #endregion
 
-                if field_name[ : 5] == 'start':
+            elif field_name[ : 3] == 'end':
 
-                    #region Start-Date
+                #region End-Date
 
-                    element = element[0]
+                element = element[1]
 
-                    #endregion
+                if field['value'] == 'present':
+                    query = 'input[data-automation-id="currentlyWorkHere"]'
+                    # check_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, query)))
 
-                elif field_name[ : 3] == 'end':
+                    # Check the check-box if not selected.
+                    # if not check_box.is_selected():
+                        # check_box.click()
 
-                    #region End-Date
+                    self.execute_java_script(f'''
+                        var checkbox = document.querySelector('{ query }');
+                        if (checkbox && !checkbox.checked) {{
+                            checkbox.click();
+                            console.log('Checkbox is now checked!');
+                        }} else {{
+                            console.log('Checkbox was already checked.');
+                        }}
+                    ''')
 
-                    element = element[1]
+                    del element
 
-                    if field['value'] == 'present':
-                        query = 'input[data-automation-id="currentlyWorkHere"]'
-                        # check_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, query)))
+                    return True # Nothing else is filled after the "currently work here" check-box.
 
-                        # Check the check-box if not selected.
-                        # if not check_box.is_selected():
-                            # check_box.click()
+                #endregion
 
-                        self.execute_java_script(f'''
-                            var checkbox = document.querySelector('{ query }');
-                            if (checkbox && !checkbox.checked) {{
-                                checkbox.click();
-                                console.log('Checkbox is now checked!');
-                            }} else {{
-                                console.log('Checkbox was already checked.');
-                            }}
-                        ''')
+            element.send_keys(field['value'])
 
-                        del element
+        del element
 
-                        return
+    #endregion
 
-                    #endregion
+    def job_source(self, driver):
+        if self.source_type == 'workday':
+            # The browser is needed only for applying; the listings are fetched directly.
+            return WorkdayJobSource(
+                self.jobs_url,
+                applied_facets = json.loads(self.config.get('source', 'applied_facets', fallback = '{}')),
+                search_text = self.config.get('source', 'search_text', fallback = ''),
+                endpoint = self.config.get('source', 'endpoint', fallback = None),
+                max_pages = self.max_pages
+            )
 
-                element.send_keys(field['value'])
+        self.search_jobs(driver)
+        return BrowserJobSource(driver, self.max_pages)
 
-            del element
+    def discover_jobs(self, source):
+        # Walking through all of the results pages, handing over only the jobs having a matching resume.
+        for jobs in source.pages():
+            # Skipping the jobs already submitted in the past runs, and the ones ruled out by the filters, without opening them.
+            jobs = self.job_filter.filter(self.ledger.unfinished(jobs))
+            resumes = self.find_resumes([job.title for job in jobs])
 
-        #endregion
+            # Checkpointing the discovered jobs; the ones already queued by an interrupted run are handed over from the queue instead.
+            yield from self.run_queue.enqueue([job for job in jobs if resumes[job.title]])
 
-    #endregion
+        self.run_queue.mark_discovery_done()
+
+    def queued_jobs(self, driver):
+        # Jobs left unfinished by an interrupted run come first, then the ones discovered now.
+        yield from self.run_queue.unfinished()
+
+        if not self.run_queue.is_discovery_done():
+            yield from self.discover_jobs(self.job_source(driver))
+
+    def create_worker(self):
+        # Workers of the pool work on the same run as this session.
+        app = WalmartJobApplication(self.config_file)
+        app.run_queue.attach(self.run_queue.run_id)
+        return app
 
     def delete_missing_resume_log(self, path):
         if os.path.exists(path):
@@ -653,33 +971,117 @@ class WalmartJobApplication:
 
         driver = self.login()
 
-        self.search_jobs(driver)
+        # Continuing the run interrupted by a crash, if there is one.
+        self.run_queue.open_run()
 
-        # Iterate through job listings and open each job in a new tab
-        job_listings = WebDriverWait(driver, WAIT_TIME).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul[aria-label^="Page"] > li'))
-        )
+        return self.apply_jobs(driver, self.queued_jobs(driver))
 
-        for job in job_listings:
+    def apply_jobs(self, driver, jobs):
+        # Applying through the pool of sessions while the listing pages are still being discovered.
+        # The session used for searching becomes a worker once the discovery is done and is closed by it.
+        pool = ApplicationPool(self.create_worker, self.workers, self.min_interval, self.prefetch, self.recycler)
+        report = pool.run(jobs, seed = (self, driver))
 
-            try:
-                # Finding the section (li element) having job details.
-                job_title_element = job.find_element(By.CSS_SELECTOR, 'a[data-automation-id="jobTitle"]')
+        if not self.run_queue.finish_run():
+            print('Some jobs are still unfinished; the next run continues with them.')
+
+        pool.save_report(report, self.report_path)
+        print(f"Applied to { report['jobs'] } jobs in { report['elapsed_seconds'] } seconds: { report['status'] }")
+
+        if self.job_filter.rejected:
+            print('Jobs filtered out:', dict(self.job_filter.rejected))
+
+        # Remembering the step latencies for the next run.
+        self.waits.save_stats()
+        print('Wait latencies (seconds):', json.dumps(self.waits.summary(), indent = 4))
+
+        # Selectors which never matched are the candidates for removal from `locators.json`.
+        self.locators.stats.save()
+        stale_locators = self.locators.stats.stale()
+        if stale_locators:
+            print('Stale selectors:', json.dumps(stale_locators, indent = 4))
+
+        if tracer.enabled:
+            tracer.export_jsonl(self.trace_jsonl_path)
+            tracer.export_chrome_trace(self.trace_chrome_path)
+            print('Time per phase (seconds):', json.dumps(tracer.summary(), indent = 4))
+
+        return report
 
-                # Pulling out the Job-Title and the Job-Link to apply for it.
-                job_title = job_title_element.text
-                job_link = job_title_element.get_attribute('href')
+    #region Daemon
 
-                # Opening the tab in the new window.
-                self.open_job_in_new_tab(driver, job_title, job_link)
+    def poll_new_jobs(self, source):
+        # Going through every page of the listing, as it isn't sorted by date and a new posting can show up on any of them.
+        new_jobs = list()
 
-            except NoSuchElementException as nsee:
-                # If we don't find the title, there must be some bug on the web portal and not our fault.
-                print(nsee) # So, simply ignore it and move on to the next job position posted.
+        for jobs in source.pages():
+            new_jobs.extend(self.postings.unseen(jobs))
 
-        # Close the driver session
-        driver.quit()
+        return newest_first(new_jobs)
+
+    def poll(self):
+        # The Workday source fetches the listing without a browser, which is started only when there is something to apply to.
+        driver = None if self.source_type == 'workday' else self.login()
+        is_applying = False
+
+        try:
+            new_jobs = self.poll_new_jobs(self.job_source(driver))
+            print(f'Found { len(new_jobs) } new or not yet queued postings.')
+
+            unfinished_jobs = self.ledger.unfinished(new_jobs)
+            jobs = self.job_filter.filter(unfinished_jobs)
+            resumes = self.find_resumes([job.title for job in jobs])
+            jobs = [job for job in jobs if resumes[job.title]]
+
+            # The postings already submitted in the past are done with; the filtered out ones and the ones without
+            # a resume are left unseen, so that they are reconsidered once the rules or the resumes change.
+            unfinished_keys = { self.ledger.job_key(job) for job in unfinished_jobs }
+            self.postings.mark_seen([job for job in new_jobs if self.ledger.job_key(job) not in unfinished_keys])
+
+            # A run left unfinished by the previous poll (or a crash) is continued along with the new jobs.
+            if not self.run_queue.open_run(create = bool(jobs)):
+                return
+
+            self.run_queue.enqueue(jobs)
+            self.run_queue.mark_discovery_done()
+
+            # Only the queued postings are seen; a failure before this point finds them again on the next poll.
+            self.postings.mark_seen(jobs)
+            is_applying = True
+        finally:
+            # The browser is handed over to the pool only when there is something to apply to.
+            if driver and not is_applying:
+                driver.quit()
+
+        self.apply_jobs(driver or self.login(), self.run_queue.unfinished())
+
+    def run_daemon(self):
+        self.delete_missing_resume_log(self.log_path)
+
+        while True:
+            start = monotonic()
+
+            try:
+                self.poll()
+            except Exception as e: # A failed poll must not stop the daemon; the next one tries again.
+                print('Poll failed:\n', e)
+
+            # The jitter keeps the polls from hitting the portal at exactly regular times.
+            delay = self.poll_interval * (1 + random.uniform(-self.poll_jitter, self.poll_jitter)) - (monotonic() - start)
+            print(f'Next poll in { max(0, delay):.0f} seconds.')
+            sleep(max(0, delay))
+
+    #endregion
 
 if __name__ == "__main__":
-    walmart_app = WalmartJobApplication()
-    walmart_app.run_application_process()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description = 'Applies to the part-time jobs at Walmart.')
+    parser.add_argument('--config', default = 'config.ini')
+    parser.add_argument('--daemon', action = 'store_true', help = 'Keep polling for the new postings instead of a single run.')
+    arguments = parser.parse_args()
+
+    walmart_app = WalmartJobApplication(arguments.config)
+
+    if arguments.daemon:
+        walmart_app.run_daemon()
+    else:
+        walmart_app.run_application_process()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import re
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+
+# Constants
+UNKNOWN_AGE = 10 ** 6  # Days ago of the postings without a readable date, so that they are sorted last.
+
+def posted_days_ago(posted_date):
+    # Workday shows the age of a posting as "Posted Today", "Posted Yesterday", "Posted 3 Days Ago" or "Posted 30+ Days Ago".
+    text = (posted_date or '').lower()
+
+    if 'today' in text:
+        return 0
+
+    if 'yesterday' in text:
+        return 1
+
+    match = re.search(r'(\d+)\+?\s*days?', text)
+    return int(match.group(1)) if match else UNKNOWN_AGE
+
+def newest_first(jobs):
+    return sorted(jobs, key = lambda job: posted_days_ago(job.posted_date))
+
+class PostingTracker:
+    # Postings handled by the previous polls, so that a poll hands over only the new (or changed) ones.
+    # A posting counts as seen only once it is queued (or known as final), so that a skipped or lost one is reconsidered.
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, timeout = 30, check_same_thread = False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS seen_postings (
+                job_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )
+        ''')
+        self.connection.commit()
+
+    def job_key(self, job):
+        return job.job_id or job.link
+
+    def fingerprint(self, job):
+        # The age of a posting changes every day by itself, so it isn't a change of the posting.
+        return hashlib.sha1(f'{ job.title }\n{ job.location }\n{ job.link }'.encode()).hexdigest()
+
+    def unseen(self, jobs):
+        # The postings of a listing page which weren't seen (or were different) before.
+        keys = [self.job_key(job) for job in jobs]
+
+        with self.lock:
+            known = dict(self.connection.execute(
+                f'SELECT job_key, fingerprint FROM seen_postings WHERE job_key IN ({ ", ".join("?" * len(keys)) })', keys
+            )) if keys else dict()
+
+        return [job for job, key in zip(jobs, keys) if known.get(key) != self.fingerprint(job)]
+
+    def mark_seen(self, jobs):
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        with self.lock:
+            self.connection.executemany('''
+                INSERT INTO seen_postings (job_key, fingerprint, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_key) DO UPDATE SET fingerprint = excluded.fingerprint, last_seen = excluded.last_seen
+            ''', [(self.job_key(job), self.fingerprint(job), now, now) for job in jobs])
+            self.connection.commit()
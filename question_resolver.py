@@ -0,0 +1,231 @@
+from collections.abc import Mapping
+from selenium.common.exceptions import WebDriverException
+from form_filler import SET_VALUE_SCRIPT
+from resume_index import normalize
+
+# Constants
+MIN_SIMILARITY = 0.6  # Minimum share of an answer's label words which must be found in a question for a fuzzy match.
+
+# Reads every question of the page in one round-trip: its label text, the kind of its control and the labels of its options.
+# Check-boxes and radio buttons are read as a group (a fieldset, e.g. a week of the availability grid) with one option per box.
+READ_QUESTIONS_SCRIPT = """
+var root = arguments[0] || document;
+var questions = [];
+var grouped = new Set();
+
+function text(node) {
+    if (!node) {
+        return '';
+    }
+
+    // Leaving out the text of the controls inside a label (e.g. "Select One" of a dropdown).
+    var copy = node.cloneNode(true);
+    copy.querySelectorAll('button, select, ul, [role="listbox"]').forEach(function (child) { child.remove(); });
+    return copy.textContent.replace(/\\s+/g, ' ').trim();
+}
+
+function labelText(control) {
+    if (control.labels && control.labels.length) {
+        return text(control.labels[0]);
+    }
+
+    var labelledBy = control.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        return labelledBy.split(' ').map(function (id) { return text(document.getElementById(id)); }).join(' ').trim();
+    }
+
+    return control.getAttribute('aria-label') || '';
+}
+
+root.querySelectorAll('fieldset, [role="group"], [role="radiogroup"]').forEach(function (group) {
+    var boxes = Array.from(group.querySelectorAll('input[type="checkbox"], input[type="radio"]')).filter(function (box) { return !grouped.has(box); });
+
+    if (!boxes.length) {
+        return;
+    }
+
+    var legend = group.querySelector('legend');
+    questions.push({
+        text: legend ? text(legend) : (group.getAttribute('aria-label') || ''),
+        kind: boxes[0].type === 'radio' ? 'radio' : 'checkboxes',
+        options: boxes.map(labelText),
+        element: group
+    });
+    boxes.forEach(function (box) { grouped.add(box); });
+});
+
+root.querySelectorAll('input, textarea, select, button[aria-haspopup="listbox"]').forEach(function (control) {
+    if (grouped.has(control) || ['hidden', 'file', 'checkbox', 'radio', 'submit', 'button'].indexOf(control.type) >= 0 && control.tagName === 'INPUT') {
+        return;
+    }
+
+    var label = labelText(control);
+    if (!label) {
+        return;
+    }
+
+    var kind = control.tagName === 'SELECT' ? 'select' : (control.tagName === 'BUTTON' ? 'dropdown' : 'text');
+    questions.push({
+        text: label,
+        kind: kind,
+        options: kind === 'select' ? Array.from(control.options).map(function (option) { return option.text.trim(); }) : [],
+        element: control
+    });
+});
+
+return questions;
+"""
+
+# Sets all of the resolved answers in one round-trip. The custom dropdowns open their options asynchronously,
+# so they are reported as unsupported and typed into instead.
+ANSWER_SCRIPT = SET_VALUE_SCRIPT + """
+var answers = arguments[0];
+var report = [];
+
+answers.forEach(function (answer) {
+    var element = answer.element;
+
+    try {
+        if (answer.kind === 'text') {
+            setValue(element, answer.value);
+            report.push(element.value === String(answer.value) ? 'filled' : 'rejected');
+        } else if (answer.kind === 'select') {
+            element.selectedIndex = answer.value;
+            element.dispatchEvent(new Event('change', { bubbles: true }));
+            report.push('filled');
+        } else if (answer.kind === 'radio') {
+            var radio = element.querySelectorAll('input[type="radio"]')[answer.value];
+            radio.click();
+            report.push(radio.checked ? 'filled' : 'rejected');
+        } else if (answer.kind === 'checkboxes') {
+            var boxes = element.querySelectorAll('input[type="checkbox"]');
+            var isFilled = true;
+
+            answer.value.forEach(function (isChecked, index) {
+                if (isChecked !== null && boxes[index].checked !== isChecked) {
+                    boxes[index].click();
+                    isFilled = isFilled && boxes[index].checked === isChecked;
+                }
+            });
+            report.push(isFilled ? 'filled' : 'rejected');
+        } else {
+            report.push('unsupported');
+        }
+    } catch (error) {
+        report.push('error: ' + error.message);
+    }
+});
+
+return report;
+"""
+
+#region Matching
+
+def match_label(text, labels):
+    # Index of the label matching the text: exactly, then after normalizing, then by the share of its words found in the text.
+    for index, label in enumerate(labels):
+        if label.strip() == text.strip():
+            return index
+
+    normalized_text = normalize(text)
+    normalized_labels = [normalize(label.replace('_', ' ')) for label in labels]
+
+    for index, label in enumerate(normalized_labels):
+        if label and label == normalized_text:
+            return index
+
+    text_words = set(normalized_text.split())
+    best_index, best_score = None, MIN_SIMILARITY
+
+    for index, label in enumerate(normalized_labels):
+        label_words = set(label.split())
+
+        if not label_words:
+            continue
+
+        score = len(label_words & text_words) / len(label_words)
+
+        # Preferring the more specific label (more of its words matched) among the equally covered ones.
+        if score > best_score or (score == best_score and best_index is not None and len(label_words) > len(normalized_labels[best_index].split())):
+            best_index, best_score = index, score
+
+    return best_index
+
+def resolve(question, answers):
+    # The index of the profile's answer matching a question read from the page and the value to set for it,
+    # the value being `None` when the profile has no (usable) answer for it.
+    index = match_label(question['text'], [label for label, _ in answers])
+    if index is None:
+        return None, None
+
+    answer = answers[index][1]
+
+    if question['kind'] == 'checkboxes':
+        # A group is answered with the days (or other options) of the profile; the unknown options are left as they are.
+        if not isinstance(answer, Mapping):
+            return index, None
+
+        option_keys = list(answer)
+        value = list()
+
+        for option in question['options']:
+            option_index = match_label(option, option_keys)
+            value.append(bool(answer[option_keys[option_index]]) if option_index is not None else None)
+
+        return index, value
+
+    if isinstance(answer, Mapping):
+        return index, None
+
+    if question['kind'] in ('select', 'radio'):
+        return index, match_label(str(answer), question['options'])
+
+    return index, str(answer)
+
+#endregion
+
+def answer_questions(driver, answers):
+    # `answers` is a list of `(label, answer)` pairs; an answer is a string, or an `{ option: bool }` object for a check-box group.
+    # Returns the question text -> status of every question found (and the label -> `missing` of every answer which
+    # matched none of them), or `None` when the page had none to read.
+    questions = driver.execute_script(READ_QUESTIONS_SCRIPT, None)
+
+    if not questions:
+        return None
+
+    resolved = list()
+    report = dict()
+    used_indexes = set()
+
+    for question in questions:
+        index, value = resolve(question, answers)
+
+        if value is None:
+            report[question['text']] = 'unanswered'
+        else:
+            resolved.append((question, value))
+            used_indexes.add(index)
+
+    missing_labels = [label for index, (label, _) in enumerate(answers) if index not in used_indexes]
+
+    if missing_labels or not resolved:
+        # Nothing is set, so that the keyboard navigation taking over starts from an untouched page.
+        report.update((label, 'missing') for label in missing_labels)
+        return report
+
+    statuses = driver.execute_script(ANSWER_SCRIPT, [
+        { 'element': question['element'], 'kind': question['kind'], 'value': value } for question, value in resolved
+    ]) if resolved else list()
+
+    for (question, value), status in zip(resolved, statuses):
+        # Typing into the controls which can't be set directly, as the keyboard navigation did.
+        if status != 'filled' and isinstance(value, str):
+            try:
+                question['element'].send_keys(value)
+                status = 'typed'
+            except WebDriverException as wde:
+                status = f'error: { wde.msg }'
+
+        report[question['text']] = status
+
+    return report
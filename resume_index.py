@@ -0,0 +1,136 @@
+import os
+import re
+
+# Constants
+MAX_EDIT_DISTANCE = 2  # Maximum number of typos allowed between a job title and a resume name.
+MIN_TOKEN_OVERLAP = 0.5  # Minimum share of the job title's words which must be covered by a resume name.
+
+# Words which describe the shift/contract rather than the job itself, so "Cashier - Part Time" is looked up as "cashier".
+IGNORED_TOKENS = { 'part', 'full', 'time', 'parttime', 'fulltime', 'temporary', 'temp', 'seasonal', 'casual', 'pt', 'ft' }
+
+def normalize(title):
+    # Removing the text in parentheses and everything which isn't a letter or a digit.
+    title = re.sub(r'\(.*?\)', ' ', title.lower())
+    return ' '.join(re.findall(r'[a-z0-9]+', title))
+
+def tokenize(normalized_title):
+    tokens = frozenset(normalized_title.split()) - IGNORED_TOKENS
+    return tokens or frozenset(normalized_title.split())
+
+def edit_distance(first, second, limit = MAX_EDIT_DISTANCE):
+    # Levenshtein distance which gives up as soon as it goes above `limit`.
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+
+    previous_row = list(range(len(second) + 1))
+
+    for row_index, first_char in enumerate(first, 1):
+        current_row = [row_index]
+
+        for column_index, second_char in enumerate(second, 1):
+            current_row.append(min(
+                previous_row[column_index] + 1,
+                current_row[column_index - 1] + 1,
+                previous_row[column_index - 1] + (first_char != second_char)
+            ))
+
+        if min(current_row) > limit:
+            return limit + 1
+
+        previous_row = current_row
+
+    return previous_row[-1]
+
+class ResumeIndex:
+    def __init__(self, folder, scorer = None):
+        self.folder = folder
+        self.mtime = None
+
+        # Optional `ResumeScorer` matching the titles which none of the name matches resolve by the resumes' text instead.
+        self.scorer = scorer
+
+        self.exact = dict() # Normalized resume name -> file name.
+        self.tokens = dict() # Normalized resume name -> set of its words.
+        self.cache = dict() # Job title -> resolved file name (or `None`), valid until the folder changes.
+
+    def refresh(self):
+        # Re-building the index only when a resume was added, removed or renamed in the folder.
+        mtime = os.stat(self.folder).st_mtime
+
+        if mtime == self.mtime:
+            return
+
+        self.mtime = mtime
+        self.exact.clear()
+        self.tokens.clear()
+        self.cache.clear()
+
+        for resume_file in os.listdir(self.folder):
+            if resume_file.lower().endswith('.pdf'):
+                key = normalize(resume_file[ : -4])
+                self.exact[key] = resume_file
+                self.tokens[key] = tokenize(key)
+
+    #region Lookup
+
+    def match(self, job_title):
+        key = normalize(job_title)
+
+        # 1. Exact match of the normalized names.
+        if key in self.exact:
+            return self.exact[key]
+
+        # 2. Token-set match: the resume which covers most of the job title's words, e.g. "Cashier - Part Time" -> "cashier.pdf".
+        job_tokens = tokenize(key)
+        best_key, best_score = None, 0
+
+        for resume_key, resume_tokens in self.tokens.items():
+            if resume_tokens <= job_tokens:
+                score = len(resume_tokens) / len(job_tokens)
+
+                if score > best_score:
+                    best_key, best_score = resume_key, score
+
+        if best_key and best_score >= MIN_TOKEN_OVERLAP:
+            return self.exact[best_key]
+
+        # 3. Edit-distance match for typos and plural forms, e.g. "Cashiers" -> "cashier.pdf".
+        job_key = ' '.join(sorted(job_tokens))
+        best_key, best_distance = None, MAX_EDIT_DISTANCE + 1
+
+        for resume_key, resume_tokens in self.tokens.items():
+            distance = edit_distance(job_key, ' '.join(sorted(resume_tokens)))
+
+            if distance < best_distance:
+                best_key, best_distance = resume_key, distance
+
+        return self.exact[best_key] if best_key else None
+
+    def match_all(self, job_titles):
+        resumes = { job_title: self.match(job_title) for job_title in job_titles }
+
+        if self.scorer is None:
+            return resumes
+
+        # The name matches still win; only the titles left over are scored against the resumes, all at once.
+        unmatched_titles = [job_title for job_title, resume_file in resumes.items() if not resume_file]
+
+        if unmatched_titles:
+            resumes.update(zip(unmatched_titles, self.scorer.best(unmatched_titles)))
+
+        return resumes
+
+    def find(self, job_title):
+        return self.find_all([job_title])[job_title]
+
+    def find_all(self, job_titles):
+        # Resolving a whole listing page in one go with a single check of the folder.
+        self.refresh()
+
+        missing_titles = list(dict.fromkeys(job_title for job_title in job_titles if job_title not in self.cache))
+        if missing_titles:
+            self.cache.update(self.match_all(missing_titles))
+
+        return { job_title: self.cache[job_title] for job_title in job_titles }
+
+    #endregion
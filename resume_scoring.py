@@ -0,0 +1,129 @@
+import os
+import zlib
+import hashlib
+import threading
+import numpy as np
+from pypdf import PdfReader
+from resume_index import normalize, IGNORED_TOKENS
+
+# Constants
+N_FEATURES = 2 ** 14  # Size of the hashed feature space; words, word pairs and character trigrams all share it.
+VECTOR_VERSION = 1  # Bumped whenever the features change, so that the vectors cached on the disk are rebuilt.
+NAME_WEIGHT = 3.0  # Weight of a resume's file name against its text, as the name usually is the job title it targets.
+MIN_SCORE = 0.6  # Minimum cosine similarity between a job and a resume for applying with it.
+MIN_MARGIN = 0.1  # Minimum lead of the best resume over the next one, so that a shared generic word (e.g. "associate") decides nothing.
+RESUME_CACHE_DIR = '.resume-cache'
+
+#region Vectors
+
+def features(text):
+    # Words (without the shift/contract ones), word pairs for the phrases and character trigrams for the typos and plurals.
+    words = [word for word in normalize(text).split() if word not in IGNORED_TOKENS]
+    grams = words + [f'{ first } { second }' for first, second in zip(words, words[1:])]
+
+    for word in words:
+        padded = f'#{ word }#'
+        grams.extend(padded[index : index + 3] for index in range(len(padded) - 2))
+
+    return grams
+
+def vectorize(texts):
+    # Hashed, sub-linearly weighted and L2-normalized term vectors, one row per text.
+    rows, columns = list(), list()
+
+    for row, text in enumerate(texts):
+        for gram in features(text):
+            rows.append(row)
+            columns.append(zlib.crc32(gram.encode()) % N_FEATURES) # `hash()` is salted per process, so it can't be cached.
+
+    matrix = np.zeros((len(texts), N_FEATURES), dtype = np.float32)
+    np.add.at(matrix, (np.array(rows, dtype = np.intp), np.array(columns, dtype = np.intp)), 1)
+    np.log1p(matrix, out = matrix)
+
+    norms = np.linalg.norm(matrix, axis = 1, keepdims = True)
+    return matrix / np.maximum(norms, 1e-12)
+
+def unit(vector):
+    # Re-normalizing a weighted sum of vectors.
+    return vector / max(np.linalg.norm(vector), 1e-12)
+
+def extract_text(path):
+    try:
+        return '\n'.join(page.extract_text() or '' for page in PdfReader(path).pages)
+    except Exception as e: # A broken or scanned PDF is still matched by its name.
+        print(f'Could not read the text of "{ path }":\n', e)
+        return ''
+
+#endregion
+
+class ResumeScorer:
+    # Scores whole pages of jobs against all of the resumes with a single matrix product.
+    def __init__(self, folder, cache_dir = RESUME_CACHE_DIR, min_score = MIN_SCORE, min_margin = MIN_MARGIN):
+        self.folder = folder
+        self.cache_dir = cache_dir
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.lock = threading.Lock()
+
+        self.vectors = dict() # Resume file -> ((size, mtime), vector)
+        self.names = list()
+        self.matrix = np.zeros((0, N_FEATURES), dtype = np.float32)
+
+    def resume_vector(self, resume_file):
+        # The text extraction is the slow part, so the vector is cached on the disk by the hash of the PDF (and its name, a part of the vector).
+        path = os.path.join(self.folder, resume_file)
+
+        with open(path, 'rb') as file:
+            digest = hashlib.sha256(resume_file.encode() + b'\0' + file.read()).hexdigest()
+
+        cache_path = os.path.join(self.cache_dir, f'{ digest }-v{ VECTOR_VERSION }.npy')
+
+        if os.path.exists(cache_path):
+            return np.load(cache_path)
+
+        name_vector, text_vector = vectorize([resume_file[ : -4], extract_text(path)])
+        vector = unit(NAME_WEIGHT * name_vector + text_vector)
+
+        os.makedirs(self.cache_dir, exist_ok = True)
+        np.save(cache_path, vector)
+        return vector
+
+    def refresh(self):
+        # Re-reading only the resumes added or changed since the last call.
+        with self.lock:
+            resume_files = sorted(name for name in os.listdir(self.folder) if name.lower().endswith('.pdf'))
+            is_changed = resume_files != self.names
+
+            for resume_file in resume_files:
+                stat = os.stat(os.path.join(self.folder, resume_file))
+                key = (stat.st_size, stat.st_mtime)
+
+                if self.vectors.get(resume_file, (None, None))[0] != key:
+                    self.vectors[resume_file] = (key, self.resume_vector(resume_file))
+                    is_changed = True
+
+            if is_changed:
+                self.vectors = { name: self.vectors[name] for name in resume_files }
+                self.names = resume_files
+                self.matrix = np.vstack([self.vectors[name][1] for name in resume_files]) if resume_files else np.zeros((0, N_FEATURES), dtype = np.float32)
+
+    def scores(self, texts):
+        # Jobs x resumes cosine similarities.
+        self.refresh()
+        return vectorize(texts) @ self.matrix.T
+
+    def best(self, texts):
+        # The best scoring resume of every text, or `None` when it is below the threshold or not clearly ahead of the next one.
+        scores = self.scores(texts)
+
+        if not self.names:
+            return [None] * len(texts)
+
+        best_indexes = scores.argmax(axis = 1)
+        best_scores = scores[np.arange(len(texts)), best_indexes]
+        runner_up_scores = np.sort(scores, axis = 1)[:, -2] if len(self.names) > 1 else np.zeros(len(texts))
+
+        return [
+            self.names[index] if score >= self.min_score and score - runner_up_score >= self.min_margin else None
+            for index, score, runner_up_score in zip(best_indexes, best_scores, runner_up_scores)
+        ]
\ No newline at end of file
@@ -0,0 +1,153 @@
+import sqlite3
+import threading
+from datetime import datetime
+from job_discovery import JobRecord
+
+# States of a queued job.
+PENDING = 'pending'
+IN_PROGRESS = 'in_progress'
+DONE = 'done'
+
+MAX_ATTEMPTS = 2  # A job failing this many times in a run isn't retried in it anymore, so that the run can finish.
+
+class RunQueue:
+    # Persistent queue of the current run, so that a crashed run continues with its unfinished jobs instead of starting over.
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, timeout = 30, check_same_thread = False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT NOT NULL,
+                discovery_done INTEGER NOT NULL DEFAULT 0,
+                finished_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS run_queue (
+                run_id INTEGER NOT NULL,
+                job_key TEXT NOT NULL,
+                job_id TEXT,
+                title TEXT,
+                link TEXT,
+                location TEXT,
+                posted_date TEXT,
+                position INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                last_step TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, job_key)
+            );
+        ''')
+        self.connection.commit()
+
+        self.run_id = None
+
+    def now(self):
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def job_key(self, job):
+        return job.job_id or job.link
+
+    def execute(self, query, parameters = ()):
+        with self.lock:
+            rows = self.connection.execute(query, parameters).fetchall()
+            self.connection.commit()
+            return rows
+
+    #region Runs
+
+    def open_run(self, create = True):
+        # Continuing the last run if it didn't finish, otherwise starting a new one (or none, without `create`).
+        rows = self.execute('SELECT run_id FROM runs WHERE finished_at IS NULL ORDER BY run_id DESC LIMIT 1')
+
+        if rows:
+            self.run_id = rows[0][0]
+            print(f'Resuming the unfinished run { self.run_id }.')
+        elif not create:
+            return None
+        else:
+            self.execute('INSERT INTO runs (started_at) VALUES (?)', (self.now(),))
+            self.run_id = self.execute('SELECT MAX(run_id) FROM runs')[0][0]
+
+        return self.run_id
+
+    def attach(self, run_id):
+        # The workers of a pool work on the run opened by the main session.
+        self.run_id = run_id
+
+    def is_discovery_done(self):
+        return bool(self.execute('SELECT discovery_done FROM runs WHERE run_id = ?', (self.run_id,))[0][0])
+
+    def mark_discovery_done(self):
+        self.execute('UPDATE runs SET discovery_done = 1 WHERE run_id = ?', (self.run_id,))
+
+    def finish_run(self):
+        # A run is finished only when none of its jobs is left; otherwise the next start resumes it.
+        if self.unfinished_count():
+            return False
+
+        self.execute('UPDATE runs SET finished_at = ? WHERE run_id = ?', (self.now(), self.run_id))
+        return True
+
+    #endregion
+
+    #region Jobs
+
+    def enqueue(self, jobs):
+        # Persisting the discovered jobs, returning only the ones which weren't queued before in this run.
+        known_keys = { row[0] for row in self.execute('SELECT job_key FROM run_queue WHERE run_id = ?', (self.run_id,)) }
+        new_jobs = [job for job in jobs if self.job_key(job) not in known_keys]
+
+        with self.lock:
+            position = self.connection.execute('SELECT COALESCE(MAX(position), 0) FROM run_queue WHERE run_id = ?', (self.run_id,)).fetchone()[0]
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO run_queue VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, 0, ?)',
+                [
+                    (self.run_id, self.job_key(job), job.job_id, job.title, job.link, job.location, job.posted_date, position + index + 1, PENDING, self.now())
+                    for index, job in enumerate(new_jobs)
+                ]
+            )
+            self.connection.commit()
+
+        return new_jobs
+
+    def unfinished(self):
+        # The jobs which were interrupted come first, as their forms are already partially saved on the portal.
+        rows = self.execute(f'''
+            SELECT job_id, title, link, location, posted_date FROM run_queue
+            WHERE run_id = ? AND state != '{ DONE }'
+            ORDER BY state = '{ IN_PROGRESS }' DESC, position
+        ''', (self.run_id,))
+
+        return [JobRecord(*row) for row in rows]
+
+    def unfinished_count(self):
+        return self.execute(f"SELECT COUNT(*) FROM run_queue WHERE run_id = ? AND state != '{ DONE }'", (self.run_id,))[0][0]
+
+    def set_state(self, job, state):
+        self.execute('UPDATE run_queue SET state = ?, updated_at = ? WHERE run_id = ? AND job_key = ?', (state, self.now(), self.run_id, self.job_key(job)))
+
+    def start(self, job):
+        self.execute(
+            'UPDATE run_queue SET state = ?, attempts = attempts + 1, updated_at = ? WHERE run_id = ? AND job_key = ?',
+            (IN_PROGRESS, self.now(), self.run_id, self.job_key(job))
+        )
+
+    def fail(self, job):
+        # Putting the job back for a later retry (at its last saved page), unless it already failed too many times.
+        self.execute(
+            f"UPDATE run_queue SET state = CASE WHEN attempts < ? THEN '{ PENDING }' ELSE '{ DONE }' END, updated_at = ? WHERE run_id = ? AND job_key = ?",
+            (MAX_ATTEMPTS, self.now(), self.run_id, self.job_key(job))
+        )
+
+    def complete_step(self, job, step):
+        self.execute('UPDATE run_queue SET last_step = ?, updated_at = ? WHERE run_id = ? AND job_key = ?', (step, self.now(), self.run_id, self.job_key(job)))
+
+    def last_step(self, job):
+        rows = self.execute('SELECT last_step FROM run_queue WHERE run_id = ? AND job_key = ?', (self.run_id, self.job_key(job)))
+        return rows[0][0] if rows else None
+
+    #endregion
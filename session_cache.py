@@ -0,0 +1,116 @@
+import os
+import json
+import threading
+from time import time
+from urllib.parse import urlparse
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Constants
+MAX_SESSION_AGE = 8 * 60 * 60  # Seconds after which a cached session is considered expired even if its cookies aren't.
+VALIDATION_WAIT_TIME = 15  # Seconds to wait for the portal to decide between the user home and the sign-in form.
+
+# A signed-in page or the sign-in form (the `email_input` locator), whichever appears first.
+SESSION_OUTCOMES = {
+    'valid': ('url', 'userHome'),
+    'rejected': 'email_input',
+}
+
+# Parallel workers share the same cache file.
+cache_lock = threading.Lock()
+
+class SessionCache:
+    def __init__(self, path, locators, max_age = MAX_SESSION_AGE):
+        self.path = path
+        self.locators = locators
+        self.max_age = max_age
+
+    #region Storage
+
+    def load(self):
+        with cache_lock:
+            if not os.path.exists(self.path):
+                return None
+
+            with open(self.path, 'r') as file:
+                session = json.load(file)
+
+        # Expiry Detection: the whole session gets too old, or its authentication cookies have expired.
+        now = time()
+
+        if now - session.get('saved_at', 0) > self.max_age:
+            print('Cached session is too old.')
+            return None
+
+        session['cookies'] = [cookie for cookie in session['cookies'] if cookie.get('expiry', now + 1) > now]
+
+        if not session['cookies']:
+            print('Cached session has no live cookies.')
+            return None
+
+        return session
+
+    def save(self, driver):
+        session = {
+            'saved_at': time(),
+            'origin': self.origin(driver.current_url),
+            'cookies': driver.get_cookies(),
+            'local_storage': driver.execute_script('return Object.assign({}, window.localStorage);'),
+        }
+
+        # Writing to a temporary file first so that a worker never reads a half-written cache.
+        with cache_lock:
+            temporary_path = f'{ self.path }.tmp'
+            with open(temporary_path, 'w') as file:
+                json.dump(session, file, indent = 4)
+            os.replace(temporary_path, self.path)
+
+    def invalidate(self):
+        with cache_lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def origin(self, url):
+        parts = urlparse(url)
+        return f'{ parts.scheme }://{ parts.netloc }'
+
+    #endregion
+
+    def restore(self, driver, login_url):
+        # Restores the cached session into a fresh driver, returning whether the portal accepted it.
+        session = self.load()
+
+        if not session:
+            return False
+
+        try:
+            # Cookies and the local storage can only be set on a page of the same origin.
+            driver.get(session['origin'])
+
+            for cookie in session['cookies']:
+                # Some drivers reject the `sameSite` values exported by others.
+                cookie.pop('sameSite', None)
+
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException as wde:
+                    print('Skipping cookie:', cookie.get('name'), wde)
+
+            driver.execute_script(
+                'for (var key in arguments[0]) { window.localStorage.setItem(key, arguments[0][key]); }',
+                session['local_storage']
+            )
+
+            # The sign-in page redirects to the user home when the session is still valid, otherwise it shows the sign-in form.
+            driver.get(login_url)
+            is_valid = self.locators.race(driver, 'session_state', SESSION_OUTCOMES, VALIDATION_WAIT_TIME, present = ('rejected',))[0] == 'valid'
+
+        except (TimeoutException, WebDriverException) as e:
+            print('Could not restore the cached session:\n', e)
+            is_valid = False
+
+        if not is_valid:
+            print('Cached session was rejected. Signing in again.')
+            self.invalidate()
+            driver.delete_all_cookies()
+
+        return is_valid
@@ -0,0 +1,227 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from waits import page_is_settled
+from form_filler import SET_VALUE_SCRIPT
+from tracing import TracedWebDriverWait as WebDriverWait
+
+# Constants
+WAIT_TIME = 10  # Same wait time as `utils.perform_action`.
+PLAN_VERSION = 1  # Bumped whenever the compiled format changes, so that stale cached plans are ignored.
+PLAN_CACHE_DIR = '.plan-cache'
+
+TEMPLATE_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Actions which only change values on the current page, and so can be grouped into a single batch.
+BATCH_ACTIONS = ('fill', 'select', 'question')
+
+# Fills/selects/answers every step of a batch in one round-trip, returning the steps it couldn't handle.
+BATCH_SCRIPT = SET_VALUE_SCRIPT + """
+var steps = arguments[0];
+var failed = [];
+
+function questionControl(text) {
+    // The control of a question is the one its label points to, or the first one in the label's container.
+    var labels = document.querySelectorAll('label, legend');
+    for (var i = 0; i < labels.length; i++) {
+        if (labels[i].innerText.trim().toLowerCase().indexOf(text.toLowerCase()) === -1) {
+            continue;
+        }
+        if (labels[i].htmlFor) {
+            return document.getElementById(labels[i].htmlFor);
+        }
+        var container = labels[i].closest('div, fieldset') || labels[i].parentElement;
+        return container.querySelector('input, textarea, select');
+    }
+    return null;
+}
+
+for (var i = 0; i < steps.length; i++) {
+    var step = steps[i];
+    var element = step.action === 'question' ? questionControl(step.question) : document.querySelector(step.selector);
+
+    if (!element) {
+        failed.push(i);
+        continue;
+    }
+
+    try {
+        if (element instanceof HTMLSelectElement) {
+            var option = Array.prototype.find.call(element.options, function (option) {
+                return option.text.trim() === step.value || option.value === step.value;
+            });
+            if (!option) {
+                failed.push(i);
+                continue;
+            }
+            setValue(element, option.value);
+        } else if (element.type === 'checkbox' || element.type === 'radio') {
+            if (!element.checked) {
+                element.click();
+            }
+        } else if (step.action !== 'select' && (element instanceof HTMLInputElement || element instanceof HTMLTextAreaElement)) {
+            setValue(element, step.value);
+        } else {
+            failed.push(i); // Custom widgets (e.g. button based dropdowns) need real clicks.
+        }
+    } catch (error) {
+        failed.push(i);
+    }
+}
+return failed;
+"""
+
+# Ready when all of the selectors of a batch are on the page (checked in a single round-trip per poll).
+ALL_PRESENT_SCRIPT = """
+return arguments[0].every(function (selector) { return document.querySelector(selector) !== null; });
+"""
+
+#region Compilation
+
+def file_hash(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+def compile_steps(config):
+    # Turns the YAML steps into stages: a click is a stage on its own, and the runs of value-only steps between them become batches.
+    steps = [dict(step) for step in config.get('steps') or []]
+    steps += [{ 'action': 'question', 'question': question['question'], 'value': question['answer'] } for question in config.get('questions') or []]
+
+    stages = list()
+    previous_click = False
+
+    for step in steps:
+        if step['action'] not in ('click',) + BATCH_ACTIONS:
+            raise ValueError(f"Unknown action in { config.get('company') }: { step['action'] }")
+
+        if step['action'] == 'click':
+            stages.append({ 'kind': 'click', 'selector': step['selector'] })
+            previous_click = True
+            continue
+
+        if not stages or stages[-1]['kind'] != 'batch':
+            # A click might have moved to another page, so the batch after it first waits for its fields (the barrier).
+            stages.append({ 'kind': 'batch', 'barrier': previous_click, 'steps': list() })
+
+        stages[-1]['steps'].append({
+            'action': step['action'],
+            'selector': step.get('selector'),
+            'question': step.get('question'),
+            'value': step.get('value'),
+            'templates': TEMPLATE_PATTERN.findall(str(step.get('value') or '')),
+        })
+        previous_click = False
+
+    return stages
+
+class PlanCache:
+    # Compiled plans keyed by the hash of their YAML file, kept in memory and on the disk.
+    plans = dict()
+    plans_lock = threading.Lock() # Companies run concurrently by the orchestrator share the cache.
+
+    def __init__(self, directory = PLAN_CACHE_DIR):
+        self.directory = directory
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f'{ key }.json')
+
+    def load(self, config_path, config):
+        with self.plans_lock:
+            return self.load_unlocked(config_path, config)
+
+    def load_unlocked(self, config_path, config):
+        key = f'{ file_hash(config_path) }-v{ PLAN_VERSION }'
+
+        if key in self.plans:
+            return self.plans[key]
+
+        if os.path.exists(self.path_for(key)):
+            with open(self.path_for(key), 'r') as file:
+                plan = Plan(json.load(file))
+        else:
+            plan = Plan(compile_steps(config))
+
+            os.makedirs(self.directory, exist_ok = True)
+            with open(self.path_for(key), 'w') as file:
+                json.dump(plan.stages, file, indent = 4)
+
+        self.plans[key] = plan
+        return plan
+
+#endregion
+
+class Plan:
+    def __init__(self, stages):
+        self.stages = stages
+
+    def templates(self):
+        return { name for stage in self.stages if stage['kind'] == 'batch' for step in stage['steps'] for name in step['templates'] }
+
+    def resolve(self, step, context):
+        return TEMPLATE_PATTERN.sub(lambda match: str(context[match.group(1)]), str(step['value']))
+
+    def check(self, context):
+        # Failing before the browser starts when the profile doesn't have a value used in the templates.
+        missing = self.templates() - set(context)
+        if missing:
+            raise KeyError(f'Profile is missing the template values: { ", ".join(sorted(missing)) }')
+
+    #region Execution
+
+    def run(self, driver, context):
+        self.check(context)
+
+        for stage in self.stages:
+            if stage['kind'] == 'click':
+                WebDriverWait(driver, WAIT_TIME).until(EC.element_to_be_clickable((By.CSS_SELECTOR, stage['selector']))).click()
+            else:
+                self.run_batch(driver, stage, context)
+
+    def run_batch(self, driver, stage, context):
+        steps = [dict(step, value = self.resolve(step, context)) for step in stage['steps']]
+
+        if stage['barrier']:
+            # Waiting once for the whole page instead of once per field.
+            selectors = [step['selector'] for step in steps if step['selector']]
+            # The click before the batch usually navigates, and a probe failing in the middle of it only means "not yet".
+            WebDriverWait(driver, WAIT_TIME, ignored_exceptions = (WebDriverException,)).until(
+                lambda driver: driver.execute_script(ALL_PRESENT_SCRIPT, selectors)
+            )
+
+            try:
+                WebDriverWait(driver, WAIT_TIME, ignored_exceptions = (WebDriverException,)).until(page_is_settled())
+            except TimeoutException: # Pages with endless animations never get quiet; the fields are there anyway.
+                pass
+
+        failed = driver.execute_script(BATCH_SCRIPT, steps)
+
+        # Falling back to the WebDriver calls for the steps the script couldn't do (e.g. custom dropdowns).
+        for index in failed:
+            self.run_step(driver, steps[index])
+
+    def run_step(self, driver, step):
+        if step['action'] == 'question':
+            print(f"Could not answer the question: { step['question'] }")
+            return
+
+        element = WebDriverWait(driver, WAIT_TIME).until(EC.visibility_of_element_located((By.CSS_SELECTOR, step['selector'])))
+
+        if step['action'] == 'select' and element.tag_name == 'select':
+            Select(element).select_by_visible_text(step['value'])
+        elif step['action'] == 'select':
+            # Custom dropdowns: opening the menu and clicking the option with the text.
+            element.click()
+            WebDriverWait(driver, WAIT_TIME).until(
+                EC.element_to_be_clickable((By.XPATH, f'//*[@role="option" or self::li][normalize-space()="{ step["value"] }"]'))
+            ).click()
+        else:
+            element.clear()
+            element.send_keys(step['value'])
+
+    #endregion
@@ -0,0 +1,105 @@
+from selenium.common.exceptions import WebDriverException
+
+# Constants
+BLANK_PAGE = 'about:blank'
+
+class TabPool:
+    # Reusable tabs of a session: the next jobs are loaded in the background tabs while the current one is being filled,
+    # and a finished tab is parked on a blank page for the next job instead of being closed.
+    def __init__(self, driver, size = 3):
+        self.driver = driver
+        self.size = max(1, size)
+
+        # The window the pool was created from (the listing); all of the tabs are driven from it.
+        self.home = driver.current_window_handle
+
+        self.names = dict() # Tab handle -> window name, which `window.open` navigates without switching to it.
+        self.loaded = dict() # Link -> handle of the tab it is loading/loaded in.
+        self.free = list()
+
+    def navigate(self, name, link):
+        # A single command from the home window, so that loading a background tab never waits for its page.
+        self.driver.execute_script('window.open(arguments[0], arguments[1]);', link, name)
+
+    def open_tab(self, link):
+        if self.free:
+            handle = self.free.pop()
+            self.navigate(self.names[handle], link)
+            return handle
+
+        if len(self.names) >= self.size:
+            return None
+
+        handles = set(self.driver.window_handles)
+        name = f'job-tab-{ len(self.names) }'
+        self.navigate(name, link)
+
+        # The new tab is the only handle which wasn't there before.
+        new_handles = set(self.driver.window_handles) - handles
+        if not new_handles:
+            return None
+
+        handle = new_handles.pop()
+        self.names[handle] = name
+        return handle
+
+    def preload(self, links):
+        # Starting to load the given job pages in the background, as long as there are tabs left for them.
+        for link in links:
+            if link in self.loaded:
+                continue
+
+            handle = self.open_tab(link)
+            if handle is None:
+                break
+
+            self.loaded[link] = handle
+
+    def open(self, link, upcoming = ()):
+        # Switching to the tab of the job (loading it if it wasn't preloaded), after queueing the next ones in the background.
+        self.preload([link])
+        self.preload(upcoming)
+
+        handle = self.loaded.pop(link, None)
+
+        try:
+            self.driver.switch_to.window(handle)
+        except (WebDriverException, TypeError): # The tab was closed by the page itself, or none was free; falling back to a fresh one.
+            self.forget(handle)
+            self.driver.switch_to.window(self.home)
+            self.driver.execute_script('window.open();')
+            handle = [window for window in self.driver.window_handles if window not in self.names and window != self.home][-1]
+            self.names[handle] = None
+            self.driver.switch_to.window(handle)
+            self.driver.get(link)
+
+        return handle
+
+    def release(self, handle):
+        # Parking the tab of a finished job on a blank page, so that its scripts stop and it can be reused.
+        self.driver.switch_to.window(self.home)
+
+        if self.names.get(handle) is None:
+            self.close(handle)
+            return
+
+        try:
+            self.navigate(self.names[handle], BLANK_PAGE)
+            self.free.append(handle)
+        except WebDriverException:
+            self.forget(handle)
+
+    def close(self, handle):
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except WebDriverException:
+            pass
+        finally:
+            self.forget(handle)
+            self.driver.switch_to.window(self.home)
+
+    def forget(self, handle):
+        self.names.pop(handle, None)
+        self.free = [free for free in self.free if free != handle]
+        self.loaded = { link: loaded for link, loaded in self.loaded.items() if loaded != handle }
@@ -0,0 +1,173 @@
+import os
+import json
+import threading
+from time import perf_counter_ns
+from functools import wraps
+from collections import defaultdict
+from contextlib import nullcontext
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Kinds of the spans: time spent waiting for the page versus time spent actually doing something on it.
+WAIT = 'wait'
+ACT = 'act'
+
+# Returned when the tracing is disabled, so that a disabled span costs a single attribute check.
+NULL_SPAN = nullcontext()
+
+class Span:
+    def __init__(self, tracer, name, kind, args):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.args = args
+        self.waited = 0 # Nanoseconds spent in the waits nested in this span.
+
+    def __enter__(self):
+        self.tracer.stack().append(self)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = perf_counter_ns()
+
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+
+        # A wait is waiting as a whole; an action is waiting only for the time of its nested waits.
+        waited = end - self.start if self.kind == WAIT else self.waited
+
+        stack = self.tracer.stack()
+        stack.pop()
+        if stack:
+            stack[-1].waited += waited
+
+        self.tracer.add(self.name, self.kind, self.start, end, waited, self.args)
+        return False
+
+class Tracer:
+    def __init__(self, enabled = False):
+        self.enabled = enabled
+        self.origin = perf_counter_ns()
+        self.spans = list()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def configure(self, enabled):
+        self.enabled = enabled
+
+    def reset(self):
+        # Dropping the spans of a finished run, e.g. between the candidates of a batch sharing a process.
+        with self.lock:
+            self.spans.clear()
+
+    def span(self, name, kind = ACT, **args):
+        if not self.enabled:
+            return NULL_SPAN
+
+        return Span(self, name, kind, args)
+
+    def stack(self):
+        # Open spans of the current thread, for nesting the waits into the phases.
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = list()
+        return self.local.stack
+
+    def add(self, name, kind, start, end, waited, args):
+        span = {
+            'name': name,
+            'kind': kind,
+            'start_us': (start - self.origin) // 1000,
+            'duration_us': (end - start) // 1000,
+            'wait_us': waited // 1000,
+            'act_us': (end - start - waited) // 1000,
+            'thread': threading.current_thread().name,
+            'thread_id': threading.get_ident(),
+            'args': args,
+        }
+
+        with self.lock:
+            self.spans.append(span)
+
+    #region Export
+
+    def summary(self):
+        # Total seconds, of which waiting and of which acting, per span name.
+        totals = defaultdict(lambda: { 'total': 0.0, WAIT: 0.0, ACT: 0.0, 'count': 0 })
+
+        with self.lock:
+            for span in self.spans:
+                totals[span['name']]['total'] += span['duration_us'] / 1e6
+                totals[span['name']][WAIT] += span['wait_us'] / 1e6
+                totals[span['name']][ACT] += span['act_us'] / 1e6
+                totals[span['name']]['count'] += 1
+
+        return { name: { key: round(value, 3) for key, value in total.items() } for name, total in totals.items() }
+
+    def export_jsonl(self, path):
+        with self.lock, open(path, 'w') as file:
+            for span in self.spans:
+                file.write(json.dumps(span) + '\n')
+
+    def export_chrome_trace(self, path):
+        # Chrome trace-event format, viewable in chrome://tracing or https://ui.perfetto.dev.
+        with self.lock:
+            events = [
+                {
+                    'name': span['name'],
+                    'cat': span['kind'],
+                    'ph': 'X',
+                    'ts': span['start_us'],
+                    'dur': span['duration_us'],
+                    'pid': os.getpid(),
+                    'tid': span['thread_id'],
+                    'args': dict(span['args'], wait_ms = span['wait_us'] / 1000, act_ms = span['act_us'] / 1000),
+                }
+                for span in self.spans
+            ]
+
+        with open(path, 'w') as file:
+            json.dump({ 'traceEvents': events, 'displayTimeUnit': 'ms' }, file)
+
+    #endregion
+
+# Single tracer of the process, shared by all of the workers.
+tracer = Tracer()
+
+def traced(name, kind = ACT):
+    # Decorator wrapping a whole function (e.g. a phase of the application) into a span.
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+
+            with Span(tracer, name, kind, dict()):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+def condition_name(method):
+    # `expected_conditions` are closures (e.g. `element_to_be_clickable.<locals>._predicate`), the others callable objects
+    # or bound methods.
+    if hasattr(method, '__self__'):
+        return method.__name__
+
+    return getattr(method, '__qualname__', type(method).__name__).split('.')[0]
+
+class TracedWebDriverWait(WebDriverWait):
+    # Drop-in `WebDriverWait` recording every wait as a span, named after the condition it waited for.
+    def until(self, method, message = ''):
+        if not tracer.enabled:
+            return super().until(method, message)
+
+        with tracer.span(f'wait.{ condition_name(method) }', WAIT):
+            return super().until(method, message)
+
+    def until_not(self, method, message = ''):
+        if not tracer.enabled:
+            return super().until_not(method, message)
+
+        with tracer.span(f'wait_not.{ condition_name(method) }', WAIT):
+            return super().until_not(method, message)
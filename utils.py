@@ -1,20 +1,52 @@
+import os
 import yaml
-from selenium import webdriver
+import importlib.util
+from driver_factory import DriverOptions, create_driver
+from candidate_profile import ProfileStore
+from step_plan import PlanCache
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
+from tracing import TracedWebDriverWait as WebDriverWait
+
+def config_path(company):
+    # The company configs live in `configs/`, falling back to the project's root for the ones not moved there yet.
+    path = f'configs/{company}.yaml'
+    return path if os.path.exists(path) else f'{company}.yaml'
+
+def list_companies():
+    # Every company having a config, in `configs/` or (not moved there yet) in the project's root.
+    names = { os.path.splitext(name)[0] for name in os.listdir('.') if name.endswith('.yaml') }
+
+    if os.path.isdir('configs'):
+        names.update(os.path.splitext(name)[0] for name in os.listdir('configs') if name.endswith('.yaml'))
+
+    return sorted(names)
 
 def load_config(company):
-    with open(f'configs/{company}.yaml', 'r') as file:
+    with open(config_path(company), 'r') as file:
         return yaml.safe_load(file)
 
+def load_plan(company):
+    # Compiled once per version of the YAML file and re-used afterwards.
+    return PlanCache().load(config_path(company), load_config(company))
+
+def load_profile_context(path):
+    # Values for the `{{...}}` templates: the top-level values of the profile JSON and its personal information fields.
+    # The profile is loaded once per process (and again only when edited), also when several companies use it.
+    profile = ProfileStore.shared(path).current()
+    context = { key: value for key, value in profile.raw.items() if isinstance(value, (str, int, float)) }
+    context.update({ field_name: field['value'] for field_name, field in profile.personal_information.items() if 'value' in field })
+    return context
+
 def load_credentials():
     with open('credentials/credentials.txt', 'r') as file:
         return yaml.safe_load(file)
 
-def get_driver():
-    # Initialize the webdriver (e.g., Chrome)
-    return webdriver.Chrome()
+def get_driver(config = None):
+    # Initialize the webdriver (Chrome unless the `browser` section of the company's config says otherwise)
+    browser_config = { 'browser': 'chrome', **((config or dict()).get('browser') or dict()) }
+    return create_driver(DriverOptions.from_config(browser_config))
 
 def perform_action(driver, action, value=None):
     if action['action'] == 'click':
@@ -28,5 +60,15 @@ def perform_action(driver, action, value=None):
         element.clear()
         element.send_keys(value)
     elif action['action'] == 'select':
-        # Code for selecting an option from a dropdown
-        pass
\ No newline at end of file
+        element = WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, action['selector']))
+        )
+        Select(element).select_by_visible_text(value)
+
+def load_application_class():
+    # The application's file name isn't a valid module name, so it is loaded by its path.
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'part-time-job-automation-walmart.py')
+    spec = importlib.util.spec_from_file_location('walmart_application', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.WalmartJobApplication
@@ -0,0 +1,278 @@
+import os
+import json
+import threading
+from time import monotonic
+from collections import deque
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from tracing import tracer, WAIT
+
+# Constants
+MAX_WAIT_TIME = 30  # Upper bound for any readiness wait (same as the `WAIT_TIME` of the application).
+SETTLE_TIME = 5  # Upper bound of a settle wait replacing the common sleep.
+SHORT_SETTLE_TIME = 2  # Upper bound of a settle wait replacing the short sleep (a key-press, a click on the form).
+MIN_SETTLE_TIME = 1.5  # Lower bound for a learned settle timeout so a lucky run doesn't make the next one too aggressive.
+QUIET_WINDOW = 0.3  # Seconds without DOM mutations before the page is considered settled.
+POLL_FREQUENCY = 0.1  # Seconds between two readiness probes.
+SAMPLE_SIZE = 50  # Number of latency samples remembered per step.
+SAFETY_MARGIN = 2.0  # Multiplier applied on the learned 95th percentile.
+
+# Installs the MutationObserver and XHR/fetch counters once per document and reports the readiness state.
+# The hooks survive until the next navigation, after which they are installed again on the first probe.
+READINESS_SCRIPT = """
+var state = window.__ptjaReadiness;
+if (!state) {
+    state = window.__ptjaReadiness = { pending: 0, lastMutation: Date.now() };
+
+    new MutationObserver(function () {
+        state.lastMutation = Date.now();
+    }).observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+
+    var open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function () {
+        this.addEventListener('loadstart', function () { state.pending++; });
+        this.addEventListener('loadend', function () { state.pending = Math.max(0, state.pending - 1); });
+        return open.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            return fetch.apply(this, arguments).finally(function () {
+                state.pending = Math.max(0, state.pending - 1);
+            });
+        };
+    }
+}
+return {
+    ready: document.readyState === 'complete',
+    pending: state.pending,
+    quiet: Date.now() - state.lastMutation
+};
+"""
+
+# Reports whether the element is displayed, enabled and where it is placed (for the stability check).
+ELEMENT_STATE_SCRIPT = """
+var element = arguments[0];
+var rect = element.getBoundingClientRect();
+return {
+    visible: !!(rect.width || rect.height) && getComputedStyle(element).visibility !== 'hidden',
+    enabled: !element.disabled && element.getAttribute('aria-disabled') !== 'true',
+    rect: [rect.x, rect.y, rect.width, rect.height]
+};
+"""
+
+# Checks all of the outcomes in one round-trip, returning the first one (in the given order) which is on the page.
+RACE_SCRIPT = """
+var outcomes = arguments[0];
+var text = null;
+
+function isUsable(element) {
+    var rect = element.getBoundingClientRect();
+    return !!(rect.width || rect.height) && !element.disabled && element.getAttribute('aria-disabled') !== 'true';
+}
+
+for (var i = 0; i < outcomes.length; i++) {
+    var outcome = outcomes[i];
+
+    if (outcome.kind === 'css') {
+        var elements = document.querySelectorAll(outcome.value);
+        for (var j = 0; j < elements.length; j++) {
+            if (isUsable(elements[j])) {
+                return [outcome.name, elements[j]];
+            }
+        }
+    } else if (outcome.kind === 'present') {
+        var present = document.querySelector(outcome.value);
+        if (present) {
+            return [outcome.name, present];
+        }
+    } else if (outcome.kind === 'xpath') {
+        var nodes = document.evaluate(outcome.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var k = 0; k < nodes.snapshotLength; k++) {
+            if (isUsable(nodes.snapshotItem(k))) {
+                return [outcome.name, nodes.snapshotItem(k)];
+            }
+        }
+    } else if (outcome.kind === 'text') {
+        text = text === null ? (document.body ? document.body.innerText.toLowerCase() : '') : text;
+        if (text.indexOf(outcome.value.toLowerCase()) !== -1) {
+            return [outcome.name, null];
+        }
+    } else if (outcome.kind === 'url' && window.location.href.indexOf(outcome.value) !== -1) {
+        return [outcome.name, null];
+    }
+}
+return null;
+"""
+
+class page_is_settled:
+    # Expected condition: document loaded, no XHR/fetch in flight and no DOM mutation for `quiet_window` seconds.
+    def __init__(self, quiet_window = QUIET_WINDOW):
+        self.quiet_window_ms = quiet_window * 1000
+
+    def __call__(self, driver):
+        state = driver.execute_script(READINESS_SCRIPT)
+        return state['ready'] and state['pending'] == 0 and state['quiet'] >= self.quiet_window_ms
+
+class element_is_ready:
+    # Expected condition: the element is visible, enabled and didn't move between two consecutive probes.
+    # `driver` may also be an element (e.g. a work-experience panel) to search the locator in.
+    def __init__(self, locator):
+        self.locator = locator
+        self.last_rect = None
+
+    def __call__(self, driver):
+        try:
+            element = driver.find_element(*self.locator)
+            state = element.parent.execute_script(ELEMENT_STATE_SCRIPT, element)
+        except (StaleElementReferenceException, WebDriverException):
+            self.last_rect = None
+            return False
+
+        if not (state['visible'] and state['enabled']):
+            self.last_rect = None
+            return False
+
+        # The element is stable only when its position is same as on the previous probe.
+        is_stable = state['rect'] == self.last_rect
+        self.last_rect = state['rect']
+
+        return element if is_stable else False
+
+class first_outcome:
+    # Expected condition: whichever of the outcomes appears first, as a `(name, element)` pair.
+    # `outcomes` is an ordered mapping of a name to a `(kind, value)` pair (or a list of them, e.g. a locator's fallbacks),
+    # the kind being `css` or `xpath` (a usable element), `present` (any element matching the CSS selector), `text` or `url`.
+    def __init__(self, outcomes):
+        self.outcomes = [
+            { 'name': name, 'kind': kind, 'value': value }
+            for name, alternatives in outcomes.items()
+            for kind, value in (alternatives if isinstance(alternatives, list) else [alternatives])
+        ]
+
+    def __call__(self, driver):
+        try:
+            result = driver.execute_script(RACE_SCRIPT, self.outcomes)
+        except WebDriverException: # The page navigated in the middle of the probe.
+            return False
+
+        return tuple(result) if result else False
+
+class AdaptiveWait:
+    # One object per statistics file is shared by all the workers of the process (see `shared()`),
+    # so that the latencies measured by every worker are learned from and saved.
+    waits = dict()
+    waits_lock = threading.Lock()
+
+    def __init__(self, stats_path = None):
+        self.stats_path = stats_path
+        self.samples = dict()
+        self.lock = threading.Lock()
+
+        self.load_stats()
+
+    @classmethod
+    def shared(cls, stats_path):
+        key = os.path.abspath(stats_path) if stats_path else None
+
+        with cls.waits_lock:
+            if key not in cls.waits:
+                cls.waits[key] = cls(stats_path)
+
+            return cls.waits[key]
+
+    #region Latency Statistics
+
+    def load_stats(self):
+        if self.stats_path and os.path.exists(self.stats_path):
+            with open(self.stats_path, 'r') as file:
+                for step, samples in json.load(file).items():
+                    self.samples[step] = deque(samples, maxlen = SAMPLE_SIZE)
+
+    def save_stats(self):
+        if self.stats_path:
+            with self.lock:
+                stats = { step: list(samples) for step, samples in self.samples.items() }
+
+            with open(self.stats_path, 'w') as file:
+                json.dump(stats, file, indent = 4)
+
+    def record(self, step, elapsed):
+        with self.lock:
+            self.samples.setdefault(step, deque(maxlen = SAMPLE_SIZE)).append(round(elapsed, 3))
+
+    def percentile(self, step, percent):
+        with self.lock:
+            samples = sorted(self.samples.get(step, ()))
+
+        if not samples:
+            return None
+
+        # Nearest-rank percentile as the sample size is too small for interpolation to matter.
+        index = min(len(samples) - 1, max(0, int(round(percent / 100 * len(samples))) - 1))
+        return samples[index]
+
+    def timeout_for(self, step, default = SETTLE_TIME):
+        # Unknown steps get the default (the sleep which the wait replaces) until a few samples are collected.
+        # The learned timeout never goes above the default, so a slow run can't make the waits longer than before.
+        p95 = self.percentile(step, 95)
+
+        if p95 is None or len(self.samples.get(step, ())) < 3:
+            return default
+
+        return min(default, max(MIN_SETTLE_TIME, p95 * SAFETY_MARGIN))
+
+    def summary(self):
+        with self.lock:
+            sizes = { step: len(samples) for step, samples in self.samples.items() }
+
+        return {
+            step: { 'p50': self.percentile(step, 50), 'p95': self.percentile(step, 95), 'samples': size }
+            for step, size in sizes.items()
+        }
+
+    #endregion
+
+    #region Waits
+
+    def until(self, driver, step, condition, timeout = MAX_WAIT_TIME):
+        # Same as `WebDriverWait.until()` but with a faster polling and the latency being recorded for the step.
+        start = monotonic()
+
+        with tracer.span(f'wait.{ step }', WAIT):
+            result = WebDriverWait(driver, timeout, poll_frequency = POLL_FREQUENCY).until(condition)
+
+        self.record(step, monotonic() - start)
+
+        return result
+
+    def settle(self, driver, step, quiet_window = QUIET_WINDOW, timeout = SETTLE_TIME):
+        # Replacement of the fixed sleeps: returns as soon as the page is quiet.
+        # The wait is soft because pages with never-ending animations (or long-polling requests) never become quiet;
+        # in that case the learned timeout for the step, capped by `timeout` (the sleep it replaces), is the upper bound.
+        start = monotonic()
+
+        try:
+            with tracer.span(f'settle.{ step }', WAIT):
+                # A probe failing while the page navigates only means that it isn't settled yet.
+                WebDriverWait(
+                    driver, self.timeout_for(step, timeout), poll_frequency = POLL_FREQUENCY, ignored_exceptions = (WebDriverException,)
+                ).until(page_is_settled(quiet_window))
+        except TimeoutException:
+            # Not a latency of the step, only the cap; recording it would keep the learned timeout at the cap for good.
+            print(f'Page did not settle for step: { step }. Moving on.')
+            return
+
+        self.record(step, monotonic() - start)
+
+    def race(self, driver, step, outcomes, timeout = MAX_WAIT_TIME):
+        # Waits for several possible outcomes at once, so that a branch is decided as soon as the page shows one of them.
+        return self.until(driver, step, first_outcome(outcomes), timeout)
+
+    def element(self, driver, step, locator, timeout = MAX_WAIT_TIME):
+        # Waits for the element to be visible, enabled and stable at its place, i.e. done with its opening animation.
+        return self.until(driver, step, element_is_ready(locator), timeout)
+
+    #endregion